@@ -6,7 +6,7 @@ CSS styles, theme configurations, and other design-related properties.
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 
@@ -22,6 +22,7 @@ class DesignConfigLoader:
         """
         self.config_path = Path(config_path)
         self.config = self._load_config()
+        self._css: Optional[str] = None
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file.
@@ -118,6 +119,19 @@ class DesignConfigLoader:
         return self.config.get("styling", {})
 
     def get_css_styles(self) -> str:
+        """Get the CSS styles, generating them on first use.
+
+        The configuration is loaded once, so the stylesheet is built once and
+        shared by every interface.
+
+        Returns:
+            CSS string with all styling applied
+        """
+        if self._css is None:
+            self._css = self._build_css_styles()
+        return self._css
+
+    def _build_css_styles(self) -> str:
         """Generate comprehensive CSS styles from configuration.
 
         Returns:
@@ -5,40 +5,84 @@ A simple Gradio interface for deepfake detection using pipeline approach.
 """
 
 import os
-from typing import List
+import shutil
+from typing import Dict, List
 
 import gradio as gr
+import torch
 from config_loader import design_config
+from runtime import (
+    DEVICE,
+    QUEUE_CONCURRENCY,
+    QUEUE_MAX_SIZE,
+    configure_runtime,
+    make_request_dir,
+    run_in_worker,
+)
 
 from mukh.pipelines.deepfake_detection import PipelineDeepfakeDetection
 
 
-def detect_deepfakes(
+def get_default_precision() -> str:
+    """Return the default inference precision for the current device.
+
+    Returns:
+        'bf16' on CUDA GPUs with compute capability 8.0+ (Ampere or newer),
+        'fp32' otherwise
+    """
+    if torch.cuda.is_available() and torch.cuda.get_device_capability()[0] >= 8:
+        return "bf16"
+    return "fp32"
+
+
+def get_pipeline(
+    model_configs: Dict[str, float],
+    confidence_threshold: float = 0.5,
+    precision: str = "fp32",
+) -> PipelineDeepfakeDetection:
+    """Return a pipeline for the given configuration.
+
+    Pipelines are cheap to build: the models they run are loaded once per
+    model and precision, and shared by every pipeline in the process.
+
+    Args:
+        model_configs: Dictionary mapping model names to their weights
+        confidence_threshold: Threshold for ensemble prediction
+        precision: Inference precision ('fp32', 'bf16' or 'fp16')
+
+    Returns:
+        A deepfake detection pipeline backed by the shared models
+    """
+    return PipelineDeepfakeDetection(
+        model_configs=model_configs,
+        device=DEVICE,
+        confidence_threshold=confidence_threshold,
+        use_jit=True,
+        use_compile=DEVICE.type == "cuda",
+        precision=precision,
+    )
+
+
+@torch.inference_mode()
+def _detect_deepfakes_sync(
     media_path: str,
     detection_method: str,
     selected_models: List[str],
     resnet_weight: float,
     efficientnet_weight: float,
+    batch_size: int = 16,
+    precision: str = "fp32",
+    early_exit_margin: float = 0.5,
 ) -> str:
-    """Detect deepfakes in an image or video using pipeline approach.
-
-    Args:
-        media_path: Path to the input media file
-        detection_method: Method to use ('ensemble' or 'individual')
-        selected_models: List of selected models for individual detection
-        resnet_weight: Weight for ResNet Inception model in ensemble
-        efficientnet_weight: Weight for EfficientNet model in ensemble
-
-    Returns:
-        String containing the results text
-    """
+    """Blocking implementation of detect_deepfakes."""
+    output_folder = None
     try:
         if not media_path or not os.path.exists(media_path):
             return "❌ Error: No valid media file provided"
 
-        # Set output folder
-        output_folder = os.path.join("output", "deepfake_detection")
-        os.makedirs(output_folder, exist_ok=True)
+        # Give each request its own output folder; the pipeline appends to
+        # its CSVs and concurrent requests must not read each other's rows
+        output_folder = make_request_dir(os.path.join("output", "deepfake_detection"))
 
         if detection_method == "ensemble":
             # Check if weights sum to 1.0
@@ -51,8 +95,8 @@ def detect_deepfakes(
                 "efficientnet": efficientnet_weight,
             }
 
-            detector = PipelineDeepfakeDetection(
-                model_configs=model_configs, device=None, confidence_threshold=0.5
+            detector = get_pipeline(
+                model_configs, confidence_threshold=0.5, precision=precision
             )
 
             # Perform detection
@@ -61,6 +105,8 @@ def detect_deepfakes(
                 output_folder=output_folder,
                 save_csv=True,
                 num_frames=11,
+                batch_size=int(batch_size),
+                early_exit_margin=early_exit_margin,
             )
 
         else:
@@ -71,8 +117,8 @@ def detect_deepfakes(
             for model_name in selected_models:
                 # Create single model detector
                 model_configs = {model_name: 1.0}
-                detector = PipelineDeepfakeDetection(
-                    model_configs=model_configs, device=None, confidence_threshold=0.5
+                detector = get_pipeline(
+                    model_configs, confidence_threshold=0.5, precision=precision
                 )
 
                 result = detector.detect(
@@ -80,6 +126,7 @@ def detect_deepfakes(
                     output_folder=output_folder,
                     save_csv=True,
                     num_frames=11,
+                    batch_size=int(batch_size),
                 )
 
         # Read pipeline results if available
@@ -95,10 +142,62 @@ def detect_deepfakes(
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
+    finally:
+        # Only the report text is returned, so nothing reads the files later
+        if output_folder is not None:
+            shutil.rmtree(output_folder, ignore_errors=True)
+
+
+async def detect_deepfakes(
+    media_path: str,
+    detection_method: str,
+    selected_models: List[str],
+    resnet_weight: float,
+    efficientnet_weight: float,
+    batch_size: int = 16,
+    precision: str = "fp32",
+    early_exit_margin: float = 0.5,
+) -> str:
+    """Detect deepfakes in an image or video using pipeline approach.
+
+    Args:
+        media_path: Path to the input media file
+        detection_method: Method to use ('ensemble' or 'individual')
+        selected_models: List of selected models for individual detection
+        resnet_weight: Weight for ResNet Inception model in ensemble
+        efficientnet_weight: Weight for EfficientNet model in ensemble
+        batch_size: Number of video frames per model forward pass
+        precision: Inference precision ('fp32', 'bf16' or 'fp16')
+        early_exit_margin: Ensemble score margin for skipping the slower model
+
+    Returns:
+        String containing the results text
+    """
+    return await run_in_worker(
+        _detect_deepfakes_sync,
+        media_path,
+        detection_method,
+        selected_models,
+        resnet_weight,
+        efficientnet_weight,
+        batch_size,
+        precision,
+        early_exit_margin,
+    )
+
 
 def create_interface():
     """Create the Gradio interface for deepfake detection."""
 
+    # Apply process-wide PyTorch inference settings
+    configure_runtime()
+
+    # Load and compile the default ensemble before the first request
+    get_pipeline(
+        {"resnet_inception": 0.5, "efficientnet": 0.5},
+        precision=get_default_precision(),
+    ).load_models()
+
     # Get theme configuration from design config
     theme_config = design_config.get_theme_config()
     theme_colors = design_config.get_theme_colors()
@@ -216,6 +315,31 @@ def create_interface():
                         info="Weight for EfficientNet model in ensemble",
                     )
 
+                batch_size = gr.Slider(
+                    minimum=1,
+                    maximum=64,
+                    value=16,
+                    step=1,
+                    label="🚀 GPU Batch Size",
+                    info="Number of video frames processed per model forward pass",
+                )
+
+                precision = gr.Radio(
+                    choices=["fp32", "bf16", "fp16"],
+                    value=get_default_precision(),
+                    label="🎚️ Inference Precision",
+                    info="Half precision (bf16/fp16) speeds up inference on CUDA GPUs",
+                )
+
+                early_exit_margin = gr.Slider(
+                    minimum=0.0,
+                    maximum=0.5,
+                    value=0.5,
+                    step=0.05,
+                    label="⏩ Early Exit Margin",
+                    info="Skip the slower ensemble model when the faster one's mean deepfake score is more than this from 0.5. Faster, but the verdict may differ from running both (0.5 = off, always runs both)",
+                )
+
                 gr.HTML(
                     """
                     <div style="background: rgba(16, 185, 129, 0.1); border: 1px solid #10b981; border-radius: 8px; padding: 15px; margin: 15px 0;">
@@ -351,11 +475,19 @@ def create_interface():
                 selected_models,
                 resnet_weight,
                 efficientnet_weight,
+                batch_size,
+                precision,
+                early_exit_margin,
             ],
             outputs=[results_text],
             show_progress=True,
         )
 
+    # Queue requests so several can run concurrently
+    interface.queue(
+        default_concurrency_limit=QUEUE_CONCURRENCY, max_size=QUEUE_MAX_SIZE
+    )
+
     return interface
 
 
@@ -4,68 +4,114 @@ Minimal Face Detection App
 A simple Gradio interface for face detection using multiple models.
 """
 
+import hashlib
 import os
-from typing import Tuple
+import threading
+from typing import Dict, Optional, Tuple
 
 import gradio as gr
+import numpy as np
+import torch
 from config_loader import design_config
+from runtime import (
+    QUEUE_CONCURRENCY,
+    QUEUE_MAX_SIZE,
+    configure_runtime,
+    make_request_dir,
+    run_in_worker,
+)
 
 from mukh.face_detection import FaceDetector
+from mukh.face_detection.models.base_detector import BaseFaceDetector
 
+# Detectors are expensive to build (weight download/load), so keep one per model
+_detector_cache: Dict[str, BaseFaceDetector] = {}
+_detector_cache_lock = threading.Lock()
 
-def detect_faces(image_path: str, detection_model: str) -> Tuple[str, str, str]:
-    """Detect faces in an image using the specified model.
+
+def get_detector(detection_model: str) -> BaseFaceDetector:
+    """Return a cached detector for the given model, creating it on first use.
 
     Args:
-        image_path: Path to the input image
-        detection_model: Model to use for detection
+        detection_model: Name of the detection model
 
     Returns:
-        Tuple of (annotated_image_path, json_path, results_text)
+        The face detector instance shared across requests
     """
+    with _detector_cache_lock:
+        detector = _detector_cache.get(detection_model)
+        if detector is None:
+            detector = FaceDetector.create(detection_model)
+            _detector_cache[detection_model] = detector
+        return detector
+
+
+@torch.inference_mode()
+def _detect_faces_sync(
+    image: Optional[np.ndarray], detection_model: str, tile_large_images: bool = False
+) -> Tuple[str, str, str]:
+    """Blocking implementation of detect_faces."""
     try:
-        if not image_path or not os.path.exists(image_path):
+        if image is None or image.size == 0:
             return None, None, "❌ Error: No valid image provided"
 
-        # Create detector
-        detector = FaceDetector.create(detection_model)
+        # Gradio delivers RGB, the detectors work on BGR
+        image = np.ascontiguousarray(image[..., 2::-1])
 
-        # Set output paths
-        output_folder = os.path.join("output", "face_detection", detection_model)
+        # Name outputs after the image content rather than an upload temp file
+        digest = hashlib.blake2b(image.tobytes(), digest_size=8).hexdigest()
+        image_name = f"{digest}.png"
+
+        # Get (cached) detector
+        detector = get_detector(detection_model)
+
+        # Set output paths, one folder per request so concurrent requests
+        # do not overwrite each other's detections.json
+        output_folder = make_request_dir(
+            os.path.join("output", "face_detection", detection_model)
+        )
         json_path = os.path.join(output_folder, "detections.json")
 
         # Detect faces
-        detections = detector.detect(
-            image_path=image_path,
+        detections = detector.detect_ndarray(
+            image=image,
+            image_name=image_name,
+            tile=tile_large_images,
             save_json=True,
             json_path=json_path,
             save_annotated=True,
             output_folder=output_folder,
         )
 
-        # Find annotated image - face detectors save with '_detected' suffix
-        image_name = os.path.basename(image_path)
-        name, ext = os.path.splitext(image_name)
-        annotated_path = os.path.join(output_folder, f"{name}_detected{ext}")
+        # Annotated image location, as named by the detector
+        annotated_path = detector.get_annotated_path(image_name, output_folder)
 
         # Create detailed results text
-        results_text = f"✅ Detection Completed Successfully\n\n"
-        results_text += f"🔍 Model Used: {detection_model.title()}\n"
-        results_text += f"📊 Faces Found: {len(detections)}\n\n"
+        rows = [
+            "✅ Detection Completed Successfully\n",
+            f"🔍 Model Used: {detection_model.title()}",
+            f"📊 Faces Found: {len(detections)}\n",
+        ]
 
         if detections:
-            results_text += "📋 Detection Details:\n"
+            rows.append("📋 Detection Details:")
             for i, detection in enumerate(detections, 1):
-                results_text += f"\nFace {i}:\n"
-                results_text += f"  • Confidence: {detection.bbox.confidence:.3f}\n"
-                results_text += f"  • Coordinates: ({detection.bbox.x1}, {detection.bbox.y1}) → ({detection.bbox.x2}, {detection.bbox.y2})\n"
-                results_text += f"  • Size: {detection.bbox.x2 - detection.bbox.x1} × {detection.bbox.y2 - detection.bbox.y1} pixels\n"
+                bbox = detection.bbox
+                rows.append(
+                    f"\nFace {i}:\n"
+                    f"  • Confidence: {bbox.confidence:.3f}\n"
+                    f"  • Coordinates: ({bbox.x1}, {bbox.y1}) → ({bbox.x2}, {bbox.y2})\n"
+                    f"  • Size: {bbox.x2 - bbox.x1} × {bbox.y2 - bbox.y1} pixels"
+                )
+            rows.append("")
         else:
-            results_text += "ℹ️ No faces were detected in the image."
+            rows.append("ℹ️ No faces were detected in the image.")
+
+        results_text = "\n".join(rows)
 
         return (
-            annotated_path if os.path.exists(annotated_path) else None,
-            json_path if os.path.exists(json_path) else None,
+            annotated_path if os.path.isfile(annotated_path) else None,
+            json_path if os.path.isfile(json_path) else None,
             results_text,
         )
 
@@ -73,9 +119,30 @@ def detect_faces(image_path: str, detection_model: str) -> Tuple[str, str, str]:
         return None, None, f"❌ Error: {str(e)}"
 
 
+async def detect_faces(
+    image: Optional[np.ndarray], detection_model: str, tile_large_images: bool = False
+) -> Tuple[str, str, str]:
+    """Detect faces in an image using the specified model.
+
+    Args:
+        image: Input image as an RGB array
+        detection_model: Model to use for detection
+        tile_large_images: Whether to detect on overlapping tiles of large images
+
+    Returns:
+        Tuple of (annotated_image_path, json_path, results_text)
+    """
+    return await run_in_worker(
+        _detect_faces_sync, image, detection_model, tile_large_images
+    )
+
+
 def create_interface():
     """Create the Gradio interface for face detection."""
 
+    # Apply process-wide PyTorch inference settings
+    configure_runtime()
+
     # Get theme configuration from design config
     theme_config = design_config.get_theme_config()
     theme_colors = design_config.get_theme_colors()
@@ -135,7 +202,7 @@ def create_interface():
                 )
 
                 input_image = gr.Image(
-                    type="filepath",
+                    type="numpy",
                     label="Upload Image",
                     height=300,
                     elem_classes=["upload-area"],
@@ -159,6 +226,12 @@ def create_interface():
                     info="Choose the AI model for face detection",
                 )
 
+                tile_large_images = gr.Checkbox(
+                    value=False,
+                    label="🧩 Tile large images for small-face recall",
+                    info="Detect on overlapping tiles so small faces in high-resolution images are not lost to downscaling. BlazeFace and UltraLight run all tiles in one batch; MediaPipe runs once per tile and is much slower",
+                )
+
                 gr.HTML(
                     """
                     <div style="background: rgba(16, 185, 129, 0.1); border: 1px solid #10b981; border-radius: 8px; padding: 15px; margin: 15px 0;">
@@ -245,11 +318,16 @@ def create_interface():
         # Event handlers
         detect_btn.click(
             fn=detect_faces,
-            inputs=[input_image, detection_model],
+            inputs=[input_image, detection_model, tile_large_images],
             outputs=[output_image, json_file, results_text],
             show_progress=True,
         )
 
+    # Queue requests so several can run concurrently
+    interface.queue(
+        default_concurrency_limit=QUEUE_CONCURRENCY, max_size=QUEUE_MAX_SIZE
+    )
+
     return interface
 
 
@@ -5,27 +5,55 @@ A simple Gradio interface for face reenactment using TPS model.
 """
 
 import os
-from typing import Tuple
+import threading
+from typing import Dict, Tuple
 
 import gradio as gr
+import torch
 from config_loader import design_config
+from runtime import (
+    DEVICE,
+    QUEUE_CONCURRENCY,
+    QUEUE_MAX_SIZE,
+    configure_runtime,
+    make_request_dir,
+    run_in_worker,
+)
 
 from mukh.reenactment import FaceReenactor
+from mukh.reenactment.models.base_reenactor import BaseFaceReenactor
 
+# Reenactors are expensive to build (checkpoint load), so keep one per model
+_reenactor_cache: Dict[str, BaseFaceReenactor] = {}
+_reenactor_cache_lock = threading.Lock()
 
-def reenact_face(
-    source_image_path: str, driving_video_path: str, reenactment_model: str
-) -> Tuple[str, str, str]:
-    """Reenact face using source image and driving video.
+
+def get_reenactor(reenactment_model: str) -> BaseFaceReenactor:
+    """Return a cached reenactor for the given model, creating it on first use.
 
     Args:
-        source_image_path: Path to the source image
-        driving_video_path: Path to the driving video
-        reenactment_model: Model to use for reenactment
+        reenactment_model: Name of the reenactment model
 
     Returns:
-        Tuple of (output_video_path, comparison_video_path, results_text)
+        The face reenactor instance shared across requests
     """
+    with _reenactor_cache_lock:
+        reenactor = _reenactor_cache.get(reenactment_model)
+        if reenactor is None:
+            reenactor = FaceReenactor.create(reenactment_model, device=str(DEVICE))
+            try:
+                reenactor.trace()
+            except Exception as e:
+                print(f"TorchScript tracing failed for {reenactment_model}: {e}")
+            _reenactor_cache[reenactment_model] = reenactor
+        return reenactor
+
+
+@torch.inference_mode()
+def _reenact_face_sync(
+    source_image_path: str, driving_video_path: str, reenactment_model: str
+) -> Tuple[str, str, str]:
+    """Blocking implementation of reenact_face."""
     try:
         if not source_image_path or not os.path.exists(source_image_path):
             return None, None, "❌ Error: No valid source image provided"
@@ -33,12 +61,14 @@ def reenact_face(
         if not driving_video_path or not os.path.exists(driving_video_path):
             return None, None, "❌ Error: No valid driving video provided"
 
-        # Create reenactor
-        reenactor = FaceReenactor.create(reenactment_model)
+        # Get (cached) reenactor
+        reenactor = get_reenactor(reenactment_model)
 
-        # Set output paths
-        output_folder = os.path.join("output", "face_reenactment", reenactment_model)
-        os.makedirs(output_folder, exist_ok=True)
+        # Set output paths, one folder per request so concurrent requests
+        # with the same file names do not overwrite each other's videos
+        output_folder = make_request_dir(
+            os.path.join("output", "face_reenactment", reenactment_model)
+        )
 
         # Perform reenactment with comparison video
         output_video_path = reenactor.reenact_from_video(
@@ -48,15 +78,17 @@ def reenact_face(
             save_comparison=True,
         )
 
-        # Generate comparison video path
+        # The reenactor names the comparison video deterministically
         source_name = os.path.splitext(os.path.basename(source_image_path))[0]
         driving_name = os.path.splitext(os.path.basename(driving_video_path))[0]
         comparison_video_path = os.path.join(
             output_folder, f"comparison_{source_name}_by_{driving_name}.mp4"
         )
+        if not os.path.isfile(comparison_video_path):
+            comparison_video_path = None
 
         # Create detailed results text
-        if output_video_path and os.path.exists(output_video_path):
+        if output_video_path and os.path.isfile(output_video_path):
             results_text = "✅ Reenactment Completed Successfully\n\n"
             results_text += f"🎬 Model Used: {reenactment_model.upper()}\n"
             results_text += f"📁 Output Location: {output_video_path}\n"
@@ -69,13 +101,13 @@ def reenact_face(
             results_text += "  • Face alignment and warping\n"
             results_text += "  • TPS (Thin Plate Spline) transformation\n"
             results_text += "  • High-quality video generation\n"
-            results_text += "  • Side-by-side comparison video created\n\n"
+            if comparison_video_path:
+                results_text += "  • Side-by-side comparison video created\n\n"
+            else:
+                results_text += "\n"
             results_text += "💾 Output: Ready for download and viewing\n"
-            results_text += f"🔄 Comparison Video: {comparison_video_path}"
-
-            # Check if comparison video exists
-            if not os.path.exists(comparison_video_path):
-                comparison_video_path = None
+            if comparison_video_path:
+                results_text += f"🔄 Comparison Video: {comparison_video_path}"
         else:
             results_text = "❌ Error: Reenactment failed to generate output video"
             comparison_video_path = None
@@ -86,9 +118,30 @@ def reenact_face(
         return None, None, f"❌ Error: {str(e)}"
 
 
+async def reenact_face(
+    source_image_path: str, driving_video_path: str, reenactment_model: str
+) -> Tuple[str, str, str]:
+    """Reenact face using source image and driving video.
+
+    Args:
+        source_image_path: Path to the source image
+        driving_video_path: Path to the driving video
+        reenactment_model: Model to use for reenactment
+
+    Returns:
+        Tuple of (output_video_path, comparison_video_path, results_text)
+    """
+    return await run_in_worker(
+        _reenact_face_sync, source_image_path, driving_video_path, reenactment_model
+    )
+
+
 def create_interface():
     """Create the Gradio interface for face reenactment."""
 
+    # Apply process-wide PyTorch inference settings
+    configure_runtime()
+
     # Get theme configuration from design config
     theme_config = design_config.get_theme_config()
     theme_colors = design_config.get_theme_colors()
@@ -272,6 +325,11 @@ def create_interface():
             show_progress=True,
         )
 
+    # Queue requests so several can run concurrently
+    interface.queue(
+        default_concurrency_limit=QUEUE_CONCURRENCY, max_size=QUEUE_MAX_SIZE
+    )
+
     return interface
 
 
@@ -0,0 +1,123 @@
+"""
+Runtime configuration for Mukh Apps.
+
+Process-wide PyTorch settings applied once when an app starts, before any
+request is served, and helpers for running inference off the event loop.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+import cv2
+import torch
+
+# Gradio queue settings shared by all apps
+QUEUE_CONCURRENCY = 4
+QUEUE_MAX_SIZE = 32
+
+# Inference device shared by all models in the process
+DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+# Per-request output folders older than this are pruned as new ones are made
+OUTPUT_MAX_AGE_SECONDS = 3600
+_REQUEST_DIR_PREFIX = "request-"
+
+_thread_local = threading.local()
+
+
+def configure_runtime() -> None:
+    """Configure PyTorch for inference-only serving.
+
+    Enables cuDNN autotuning, since each model sees a fixed input shape, and
+    TF32 matmuls/convolutions on GPUs that support them. The CUDA context is
+    created here so the first request does not pay for it. OpenCV, used for
+    image decoding and annotation, gets half the CPU cores.
+    """
+    cv2.setNumThreads(max(1, (os.cpu_count() or 1) // 2))
+    cv2.setUseOptimized(True)
+
+    torch.backends.cudnn.benchmark = True
+
+    if DEVICE.type == "cuda":
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+
+        torch.cuda.init()
+        torch.empty(1, device=DEVICE).add_(1).cpu()
+
+
+@contextmanager
+def cuda_stream() -> Iterator[None]:
+    """Run the enclosed work on the calling thread's own CUDA stream.
+
+    Each worker thread gets a dedicated stream so concurrent requests can
+    overlap transfers and compute. The stream is synchronized on exit so
+    results are ready when the handler returns. Does nothing without CUDA.
+    """
+    if not torch.cuda.is_available():
+        yield
+        return
+
+    stream = getattr(_thread_local, "stream", None)
+    if stream is None:
+        stream = torch.cuda.Stream()
+        _thread_local.stream = stream
+
+    try:
+        with torch.cuda.stream(stream):
+            yield
+    finally:
+        stream.synchronize()
+
+
+async def run_in_worker(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking inference function in a worker thread.
+
+    Args:
+        fn: Blocking function to call
+        *args: Positional arguments passed to fn
+
+    Returns:
+        The return value of fn
+    """
+
+    def run() -> Any:
+        with cuda_stream():
+            return fn(*args)
+
+    return await asyncio.to_thread(run)
+
+
+def make_request_dir(output_root: str) -> str:
+    """Create a fresh output folder for a single request.
+
+    Concurrent requests must not share output files, so each one writes to
+    its own folder under output_root. Folders left by earlier requests are
+    removed once they are older than OUTPUT_MAX_AGE_SECONDS; by then Gradio
+    has long copied any returned files into its own cache.
+
+    Args:
+        output_root: Folder the request folders are created in
+
+    Returns:
+        Path to the new, empty request folder
+    """
+    os.makedirs(output_root, exist_ok=True)
+
+    cutoff = time.time() - OUTPUT_MAX_AGE_SECONDS
+    with os.scandir(output_root) as entries:
+        for entry in entries:
+            if (
+                entry.name.startswith(_REQUEST_DIR_PREFIX)
+                and entry.is_dir(follow_symlinks=False)
+                and entry.stat().st_mtime < cutoff
+            ):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    return tempfile.mkdtemp(prefix=_REQUEST_DIR_PREFIX, dir=output_root)
@@ -0,0 +1,208 @@
+"""Alternative inference backends for fixed-shape image models.
+
+This module provides ONNX Runtime and TensorRT runners that can stand in for a
+PyTorch module taking a single NCHW float tensor and returning a single
+tensor. Both backends are optional dependencies and are imported lazily.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from .jit import get_jit_cache_dir, weights_fingerprint
+
+BACKENDS = ("torch", "onnx", "trt")
+
+# TensorRT modules keyed by (model name, batch, height, width)
+_trt_engines: Dict[Tuple[str, int, int, int], Any] = {}
+
+
+def export_onnx(
+    module: nn.Module,
+    example_input: torch.Tensor,
+    cache_key: str,
+    weights_path: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> str:
+    """Returns an ONNX export of a module, exporting it if needed.
+
+    An ``.onnx`` file next to the weights is used as is. Otherwise the module
+    is exported once into the cache directory with a dynamic batch dimension.
+
+    Args:
+        module: Module to export. It is put in eval mode.
+        example_input: Example input with the shape used at inference time
+        cache_key: Identifier of the module and its weights
+        weights_path: Optional path to the model weights
+        cache_dir: Directory for exported models. Uses get_jit_cache_dir() if None.
+
+    Returns:
+        Path to the ONNX model
+    """
+    if weights_path is not None:
+        onnx_path = os.path.splitext(weights_path)[0] + ".onnx"
+        if os.path.exists(onnx_path):
+            return onnx_path
+
+    key = "|".join([cache_key, weights_fingerprint(module), torch.__version__])
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    onnx_path = os.path.join(cache_dir or get_jit_cache_dir(), f"{digest}.onnx")
+    if os.path.exists(onnx_path):
+        return onnx_path
+
+    os.makedirs(os.path.dirname(onnx_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(onnx_path), suffix=".tmp")
+    os.close(fd)
+
+    module.eval()
+    with torch.no_grad():
+        torch.onnx.export(
+            module,
+            example_input,
+            tmp_path,
+            input_names=["input"],
+            output_names=["output"],
+            dynamic_axes={"input": {0: "batch"}, "output": {0: "batch"}},
+            opset_version=17,
+        )
+    os.replace(tmp_path, onnx_path)
+
+    return onnx_path
+
+
+class OnnxRunner:
+    """Runs an ONNX model with ONNX Runtime.
+
+    Attributes:
+        session: ONNX Runtime inference session
+        device: Device the model inputs and outputs live on
+    """
+
+    def __init__(self, onnx_path: str, device: torch.device):
+        """Creates the inference session.
+
+        Args:
+            onnx_path: Path to the ONNX model
+            device: Device the model inputs and outputs live on
+
+        Raises:
+            ImportError: If onnxruntime is not installed
+        """
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            raise ImportError(
+                "The 'onnx' backend requires onnxruntime. "
+                "Install it with: pip install onnxruntime-gpu"
+            )
+
+        self.device = torch.device(device)
+
+        providers = ["CPUExecutionProvider"]
+        if self.device.type == "cuda":
+            providers.insert(0, "CUDAExecutionProvider")
+        self.session = ort.InferenceSession(onnx_path, providers=providers)
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        """Runs the model on a batch.
+
+        Args:
+            x: Float tensor of shape (N, C, H, W)
+
+        Returns:
+            Model output on the input device
+        """
+        x = x.float().contiguous()
+
+        if x.device.type != "cuda":
+            outputs = self.session.run(None, {"input": x.numpy()})
+            return torch.from_numpy(outputs[0])
+
+        # Bind the CUDA input in place to avoid a host round trip
+        torch.cuda.current_stream().synchronize()
+        binding = self.session.io_binding()
+        binding.bind_input(
+            name="input",
+            device_type="cuda",
+            device_id=x.device.index or 0,
+            element_type=np.float32,
+            shape=tuple(x.shape),
+            buffer_ptr=x.data_ptr(),
+        )
+        binding.bind_output("output")
+        self.session.run_with_iobinding(binding)
+
+        return torch.from_numpy(binding.copy_outputs_to_cpu()[0]).to(x.device)
+
+
+class TensorRTRunner:
+    """Runs a module through TensorRT engines built per input shape.
+
+    Engines are built on first use for each batch shape and shared across
+    runners in the process.
+
+    Attributes:
+        module: Module the engines are built from
+        name: Identifier of the module and its weights
+    """
+
+    def __init__(self, module: nn.Module, name: str):
+        """Initializes the runner.
+
+        Args:
+            module: Module to build engines from. It is put in eval mode.
+            name: Identifier of the module and its weights
+
+        Raises:
+            ImportError: If torch_tensorrt is not installed
+        """
+        try:
+            import torch_tensorrt  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "The 'trt' backend requires torch_tensorrt. "
+                "Install it with: pip install torch-tensorrt"
+            )
+
+        self.module = module.eval()
+        self.name = name
+
+    def _get_engine(self, shape: Tuple[int, int, int, int]) -> Any:
+        """Returns the engine for an input shape, building it if needed.
+
+        Args:
+            shape: Input shape (N, C, H, W)
+
+        Returns:
+            Compiled TensorRT module
+        """
+        import torch_tensorrt
+
+        batch, _, height, width = shape
+        key = (self.name, batch, height, width)
+        if key not in _trt_engines:
+            _trt_engines[key] = torch_tensorrt.compile(
+                self.module,
+                inputs=[torch_tensorrt.Input(shape=shape, dtype=torch.float)],
+                enabled_precisions={torch.half},
+            )
+
+        return _trt_engines[key]
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        """Runs the model on a batch.
+
+        Args:
+            x: Float CUDA tensor of shape (N, C, H, W)
+
+        Returns:
+            Model output in float32
+        """
+        x = x.float().contiguous()
+        engine = self._get_engine(tuple(x.shape))
+        return engine(x).float()
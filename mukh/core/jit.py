@@ -0,0 +1,142 @@
+"""Compilation utilities for inference-only model optimization.
+
+This module traces fixed-shape models into frozen, inference-optimized
+TorchScript modules, or compiles them with torch.compile, and caches the
+results on disk so that process restarts can skip most of the warmup.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Optional
+
+import torch
+import torch.nn as nn
+
+_CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "mukh")
+
+
+def get_jit_cache_dir() -> str:
+    """Returns the directory used to cache traced models.
+
+    The location can be overridden with the ``MUKH_JIT_CACHE_DIR`` environment
+    variable.
+
+    Returns:
+        Path to the TorchScript cache directory
+    """
+    return os.environ.get("MUKH_JIT_CACHE_DIR", os.path.join(_CACHE_ROOT, "jit"))
+
+
+def weights_fingerprint(module: nn.Module) -> str:
+    """Returns a digest of a module's parameters and buffers.
+
+    Used in cache keys so that cached artifacts are rebuilt when the weights
+    behind a path or model name change.
+
+    Args:
+        module: Module whose state dict is hashed
+
+    Returns:
+        Hex digest of the state dict names, shapes, dtypes and values
+    """
+    hasher = hashlib.sha1()
+    for name, tensor in module.state_dict().items():
+        tensor = tensor.detach().cpu().contiguous()
+        hasher.update(f"{name}|{tuple(tensor.shape)}|{tensor.dtype}".encode("utf-8"))
+        hasher.update(tensor.view(-1).view(torch.uint8).numpy().tobytes())
+
+    return hasher.hexdigest()
+
+
+def trace_module(
+    module: nn.Module,
+    example_input: torch.Tensor,
+    cache_key: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    strict: bool = True,
+) -> torch.jit.ScriptModule:
+    """Traces, freezes and optimizes a module for inference.
+
+    If a cache key is given, the traced module is saved to disk and loaded from
+    there on later calls with the same key, weights, input shape, device and
+    PyTorch version.
+
+    Args:
+        module: Module to trace. It is put in eval mode.
+        example_input: Example input with the shape used at inference time
+        cache_key: Identifier of the module and its weights. Disables the disk
+            cache if None.
+        cache_dir: Directory for cached traces. Uses get_jit_cache_dir() if None.
+        strict: Whether to require tensor (or tuple) outputs. Set to False for
+            modules returning dictionaries.
+
+    Returns:
+        The traced TorchScript module
+    """
+    cache_path = None
+    if cache_key is not None:
+        digest = hashlib.sha1(
+            "|".join(
+                [
+                    cache_key,
+                    weights_fingerprint(module),
+                    str(tuple(example_input.shape)),
+                    example_input.device.type,
+                    torch.__version__,
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+        cache_path = os.path.join(cache_dir or get_jit_cache_dir(), f"{digest}.pt")
+
+        if os.path.exists(cache_path):
+            return torch.jit.load(cache_path, map_location=example_input.device)
+
+    module.eval()
+    with torch.no_grad():
+        traced = torch.jit.trace(module, example_input, strict=strict)
+    traced = torch.jit.optimize_for_inference(torch.jit.freeze(traced))
+
+    if cache_path is not None:
+        # Write to a unique temporary file first so concurrent processes
+        # never load a partially written trace
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        os.close(fd)
+        torch.jit.save(traced, tmp_path)
+        os.replace(tmp_path, cache_path)
+
+    return traced
+
+
+def compile_module(module: nn.Module, mode: str = "default") -> nn.Module:
+    """Compiles a module for inference with torch.compile.
+
+    Compiled kernels are cached in ``TORCHINDUCTOR_CACHE_DIR``, which defaults
+    to a mukh cache directory so restarts reuse them. Compilation happens on
+    the first call, so callers should warm the module up with representative
+    inputs. Shapes use automatic dynamic mode: a dimension that changes
+    between calls, such as the batch size, is recompiled once as dynamic.
+
+    Args:
+        module: Module to compile. It is put in eval mode.
+        mode: torch.compile mode (default: 'default'). Avoid
+            'reduce-overhead' when the module is called from several threads:
+            its CUDA graphs keep per-thread state, so a graph warmed up on one
+            thread is not reused on another.
+
+    Returns:
+        The compiled module
+
+    Raises:
+        RuntimeError: If torch.compile is not available
+    """
+    if not hasattr(torch, "compile"):
+        raise RuntimeError("torch.compile requires PyTorch 2.0 or later")
+
+    os.environ.setdefault(
+        "TORCHINDUCTOR_CACHE_DIR", os.path.join(_CACHE_ROOT, "inductor")
+    )
+
+    module.eval()
+    return torch.compile(module, mode=mode, fullgraph=False, dynamic=None)
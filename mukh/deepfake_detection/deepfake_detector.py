@@ -6,7 +6,7 @@ face detection module for consistency.
 """
 
 import os
-from typing import List, Union
+from typing import List, Optional, Union
 
 from ..core.types import DeepfakeDetection
 from .models.efficientnet.efficientnet_detector import EfficientNetDetector
@@ -31,6 +31,7 @@ class DeepfakeDetector:
         model_path: str = None,
         confidence_threshold: float = 0.5,
         device: str = None,
+        precision: str = "fp32",
         **kwargs,
     ):
         """Initializes the deepfake detector.
@@ -40,6 +41,8 @@ class DeepfakeDetector:
             model_path: Optional custom path to model weights file
             confidence_threshold: Minimum confidence threshold for detections
             device: Device to run inference on ('cpu' or 'cuda'). Auto-detected if None
+            precision: Inference precision ('fp32', 'bf16' or 'fp16'). Half
+                precisions only apply on CUDA devices
             **kwargs: Additional arguments passed to the specific detector
 
         Raises:
@@ -53,12 +56,14 @@ class DeepfakeDetector:
                 model_path=model_path,
                 confidence_threshold=confidence_threshold,
                 device=device,
+                precision=precision,
             )
         elif model_name == "efficientnet":
             self.detector = EfficientNetDetector(
                 model_path=model_path,
                 confidence_threshold=confidence_threshold,
                 device=device,
+                precision=precision,
                 **kwargs,
             )
         else:
@@ -100,6 +105,7 @@ class DeepfakeDetector:
         save_annotated: bool = False,
         output_folder: str = "output",
         num_frames: int = 11,
+        batch_size: int = 16,
     ) -> List[DeepfakeDetection]:
         """Detects deepfake in the given video.
 
@@ -110,6 +116,7 @@ class DeepfakeDetector:
             save_annotated: Whether to save annotated video with results
             output_folder: Folder path where to save annotated videos
             num_frames: Number of equally spaced frames to analyze
+            batch_size: Number of frames per model forward pass
 
         Returns:
             List of DeepfakeDetection objects for analyzed frames
@@ -121,6 +128,7 @@ class DeepfakeDetector:
             save_annotated=save_annotated,
             output_folder=output_folder,
             num_frames=num_frames,
+            batch_size=batch_size,
         )
 
     def detect(
@@ -131,6 +139,7 @@ class DeepfakeDetector:
         save_annotated: bool = False,
         output_folder: str = "output",
         num_frames: int = 11,
+        batch_size: int = 16,
     ) -> Union[DeepfakeDetection, List[DeepfakeDetection]]:
         """Detects deepfake in the given media file (image or video).
 
@@ -144,6 +153,7 @@ class DeepfakeDetector:
             save_annotated: Whether to save annotated media with results
             output_folder: Folder path where to save annotated media
             num_frames: Number of equally spaced frames to analyze for videos (default: 11)
+            batch_size: Number of video frames per model forward pass (default: 16)
 
         Returns:
             DeepfakeDetection for images, List[DeepfakeDetection] for videos
@@ -179,10 +189,36 @@ class DeepfakeDetector:
                 save_annotated=save_annotated,
                 output_folder=output_folder,
                 num_frames=num_frames,
+                batch_size=batch_size,
             )
         else:
             raise ValueError(f"Unsupported file format: {ext}")
 
+    def trace(self, cache_dir: Optional[str] = None) -> None:
+        """Replaces the underlying model with a traced TorchScript module.
+
+        Args:
+            cache_dir: Directory for cached traces. Uses the default if None.
+        """
+        self.detector.trace(cache_dir=cache_dir)
+
+    def compile(self, mode: str = "default") -> None:
+        """Compiles the underlying model with torch.compile and warms it up.
+
+        Args:
+            mode: torch.compile mode
+        """
+        self.detector.compile(mode=mode)
+
+    def load_backend(self, backend: str, cache_dir: Optional[str] = None) -> None:
+        """Runs the underlying model with an ONNX Runtime or TensorRT backend.
+
+        Args:
+            backend: Inference backend ('torch', 'onnx' or 'trt')
+            cache_dir: Directory for exported models. Uses the default if None.
+        """
+        self.detector.load_backend(backend, cache_dir)
+
     def get_model_info(self) -> dict:
         """Returns information about the current model.
 
@@ -193,6 +229,7 @@ class DeepfakeDetector:
         return {
             "model_name": self.model_name,
             "confidence_threshold": self.confidence_threshold,
+            "precision": self.detector.precision,
             "device": (
                 str(self.detector.device)
                 if hasattr(self.detector, "device")
@@ -6,14 +6,24 @@ must inherit from, ensuring a consistent interface across different models.
 
 import csv
 import os
+import threading
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
+import torch
 
+from ...core.backends import BACKENDS, OnnxRunner, TensorRTRunner, export_onnx
 from ...core.types import DeepfakeDetection
 
+# Autocast dtype for each supported inference precision (None = full precision)
+PRECISION_DTYPES = {
+    "fp32": None,
+    "bf16": torch.bfloat16,
+    "fp16": torch.float16,
+}
+
 
 class BaseDeepfakeDetector(ABC):
     """Abstract base class for deepfake detector implementations.
@@ -21,18 +31,86 @@ class BaseDeepfakeDetector(ABC):
     All deepfake detector implementations must inherit from this class and implement
     the required abstract methods.
 
+    Implementations are expected to set a ``device`` attribute.
+
     Attributes:
         confidence_threshold: Float threshold (0-1) for detection confidence.
+        precision: Inference precision ('fp32', 'bf16' or 'fp16').
     """
 
-    def __init__(self, confidence_threshold: float = 0.5):
+    def __init__(self, confidence_threshold: float = 0.5, precision: str = "fp32"):
         """Initializes the deepfake detector.
 
         Args:
             confidence_threshold: Minimum confidence threshold for detections.
                 Defaults to 0.5.
+            precision: Inference precision ('fp32', 'bf16' or 'fp16'). Half
+                precisions only apply on CUDA devices. Defaults to 'fp32'.
+
+        Raises:
+            ValueError: If the precision is not supported.
         """
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(
+                f"Unsupported precision: {precision}. "
+                f"Available precisions: {list(PRECISION_DTYPES.keys())}"
+            )
+
         self.confidence_threshold = confidence_threshold
+        self.precision = precision
+
+        # Serializes model calls when the detector is shared between threads,
+        # so compiled models are never compiled or run concurrently
+        self._inference_lock = threading.Lock()
+
+    def _autocast(self) -> torch.autocast:
+        """Returns the autocast context for the configured precision.
+
+        Returns:
+            torch.autocast context, disabled for fp32 or non-CUDA devices.
+        """
+        dtype = PRECISION_DTYPES[self.precision]
+        return torch.autocast(
+            device_type="cuda",
+            dtype=dtype or torch.float16,
+            enabled=dtype is not None and self.device.type == "cuda",
+        )
+
+    def _load_backend(
+        self,
+        backend: str,
+        example_input: torch.Tensor,
+        cache_key: str,
+        weights_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        """Replaces ``self.model`` with a runner for the given backend.
+
+        Args:
+            backend: Inference backend ('torch', 'onnx' or 'trt')
+            example_input: Example model input with the inference shape
+            cache_key: Identifier of the model and its weights
+            weights_path: Optional path to the model weights. An ``.onnx`` file
+                next to it is loaded instead of exporting the model.
+            cache_dir: Directory for exported models. Uses the default if None.
+
+        Raises:
+            ValueError: If the backend is not supported or requires CUDA.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unsupported backend: {backend}. Available backends: {list(BACKENDS)}"
+            )
+
+        if backend == "onnx":
+            onnx_path = export_onnx(
+                self.model, example_input, cache_key, weights_path, cache_dir
+            )
+            self.model = OnnxRunner(onnx_path, self.device)
+        elif backend == "trt":
+            if self.device.type != "cuda":
+                raise ValueError("The 'trt' backend requires a CUDA device")
+            self.model = TensorRTRunner(self.model, cache_key)
 
     def _load_image(self, image_path: str) -> np.ndarray:
         """Loads an image from disk in BGR format.
@@ -362,11 +440,75 @@ class BaseDeepfakeDetector(ABC):
 
         return output_path
 
+    def _get_frame_indices(self, total_frames: int, num_frames: int) -> List[int]:
+        """Computes the indices of equally spaced frames in a video.
+
+        Args:
+            total_frames: Total number of frames in the video.
+            num_frames: Number of frames to extract.
+
+        Returns:
+            List of frame indices.
+
+        Raises:
+            ValueError: If the video has fewer than num_frames frames.
+        """
+        if total_frames < num_frames:
+            raise ValueError(
+                f"Video has only {total_frames} frames, cannot extract {num_frames} frames"
+            )
+
+        if num_frames == 1:
+            return [total_frames // 2]  # Middle frame
+
+        # Equally space frames across the video
+        return [
+            int(i * (total_frames - 1) / (num_frames - 1)) for i in range(num_frames)
+        ]
+
+    def _extract_frames_torchcodec(
+        self, video_path: str, num_frames: int
+    ) -> List[Tuple[int, np.ndarray]]:
+        """Extracts equally spaced frames by seeking with torchcodec.
+
+        Args:
+            video_path: Path to the video file.
+            num_frames: Number of frames to extract.
+
+        Returns:
+            List of tuples containing (frame_number, frame_array) in BGR format.
+
+        Raises:
+            ImportError: If torchcodec is not installed.
+            RuntimeError: If torchcodec cannot load FFmpeg or decode the video.
+            ValueError: If the frame count is unknown or too small.
+        """
+        from torchcodec.decoders import VideoDecoder
+
+        decoder = VideoDecoder(video_path)
+        total_frames = decoder.metadata.num_frames
+        if total_frames is None:
+            raise ValueError("Video metadata does not report a frame count")
+
+        frame_indices = self._get_frame_indices(total_frames, num_frames)
+
+        # Decoded frames are RGB in NCHW layout
+        frames = decoder.get_frames_at(indices=frame_indices).data
+        frames = frames.permute(0, 2, 3, 1).numpy()[..., ::-1]
+
+        return [
+            (frame_idx, np.ascontiguousarray(frame))
+            for frame_idx, frame in zip(frame_indices, frames)
+        ]
+
     def _extract_equally_spaced_frames(
         self, video_path: str, num_frames: int = 11
     ) -> List[Tuple[int, np.ndarray]]:
         """Extracts equally spaced frames from a video.
 
+        Uses torchcodec to decode only the requested frames when it is
+        installed, and falls back to OpenCV if it is missing or fails.
+
         Args:
             video_path: Path to the video file.
             num_frames: Number of frames to extract (default: 11).
@@ -377,26 +519,29 @@ class BaseDeepfakeDetector(ABC):
         Raises:
             ValueError: If the video cannot be loaded or has insufficient frames.
         """
+        if not os.path.exists(video_path):
+            raise ValueError(f"Video path does not exist: {video_path}")
+
+        try:
+            return self._extract_frames_torchcodec(video_path, num_frames)
+        except ImportError:
+            pass
+        except Exception as e:
+            # torchcodec raises at import when the FFmpeg libraries are
+            # missing, and on streams it cannot index or decode
+            print(f"torchcodec frame extraction failed, using OpenCV: {e}")
+
         cap = self._load_video(video_path)
 
         # Get total number of frames
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
-        if total_frames < num_frames:
-            cap.release()
-            raise ValueError(
-                f"Video has only {total_frames} frames, cannot extract {num_frames} frames"
-            )
-
         # Calculate frame indices to extract
-        if num_frames == 1:
-            frame_indices = [total_frames // 2]  # Middle frame
-        else:
-            # Equally space frames across the video
-            frame_indices = [
-                int(i * (total_frames - 1) / (num_frames - 1))
-                for i in range(num_frames)
-            ]
+        try:
+            frame_indices = self._get_frame_indices(total_frames, num_frames)
+        except ValueError:
+            cap.release()
+            raise
 
         extracted_frames = []
 
@@ -21,8 +21,10 @@ from torchvision import transforms
 
 from mukh.deepfake_detection.models.efficientnet.architectures import fornet, weights
 
+from ....core.jit import compile_module, trace_module
 from ....core.types import DeepfakeDetection
 from ..base import BaseDeepfakeDetector
+from ..preprocessing import GpuPreprocessor
 
 
 class EfficientNetDetector(BaseDeepfakeDetector):
@@ -36,7 +38,8 @@ class EfficientNetDetector(BaseDeepfakeDetector):
         model: The EfficientNet model for deepfake detection
         confidence_threshold: Minimum confidence for valid detections
         face_size: Input face size for preprocessing
-        transform: Image preprocessing transforms
+        transform: Face crop padding/resizing transforms (run on CPU)
+        preprocessor: Batched normalization on the inference device
         face_policy: Face extraction policy ('scale' or 'tight')
         mean: ImageNet normalization mean values
         std: ImageNet normalization std values
@@ -51,6 +54,7 @@ class EfficientNetDetector(BaseDeepfakeDetector):
         train_db: str = "DFDC",
         face_policy: str = "scale",
         face_size: int = 224,
+        precision: str = "fp32",
     ):
         """Initializes the EfficientNet deepfake detector.
 
@@ -62,8 +66,9 @@ class EfficientNetDetector(BaseDeepfakeDetector):
             train_db: Training database ('DFDC', 'FFPP')
             face_policy: Face extraction policy ('scale' or 'tight')
             face_size: Input face size for preprocessing
+            precision: Inference precision ('fp32', 'bf16' or 'fp16')
         """
-        super().__init__(confidence_threshold)
+        super().__init__(confidence_threshold, precision)
 
         # Set device
         if device is None:
@@ -82,6 +87,10 @@ class EfficientNetDetector(BaseDeepfakeDetector):
 
         # Initialize transforms
         self.transform = self._get_transformer()
+        normalizer = self.model.get_normalizer()
+        self.preprocessor = GpuPreprocessor(
+            self.device, mean=normalizer.mean, std=normalizer.std
+        )
 
     def _create_model(self) -> nn.Module:
         """Creates the EfficientNet model architecture.
@@ -126,15 +135,88 @@ class EfficientNetDetector(BaseDeepfakeDetector):
         return net
 
     def _get_transformer(self) -> transforms.Compose:
-        """Gets the image transformer based on face policy and model normalizer.
+        """Gets the face crop transformer based on face policy.
+
+        Normalization is left to the batched device preprocessor.
 
         Returns:
-            Composed transforms for image preprocessing
+            Composed transforms for padding and resizing face crops
         """
         from mukh.deepfake_detection.models.efficientnet.isplutils import utils
 
         return utils.get_transformer(
-            self.face_policy, self.face_size, self.model.get_normalizer(), train=False
+            self.face_policy,
+            self.face_size,
+            self.model.get_normalizer(),
+            train=False,
+            normalize=False,
+        )
+
+    def trace(self, cache_dir: Optional[str] = None) -> None:
+        """Replaces the model with a traced TorchScript module.
+
+        Args:
+            cache_dir: Directory for cached traces. Uses the default if None.
+        """
+        # The memory-efficient swish is a custom autograd function that
+        # cannot be traced
+        self.model.efficientnet.set_swish(memory_efficient=False)
+
+        example_input = torch.zeros(
+            1, 3, self.face_size, self.face_size, device=self.device
+        )
+        self.model = trace_module(
+            self.model,
+            example_input,
+            cache_key=f"efficientnet:{self.net_model}_{self.train_db}",
+            cache_dir=cache_dir,
+        )
+
+    def compile(self, mode: str = "default") -> None:
+        """Compiles the model with torch.compile and warms it up.
+
+        The batch dimension is compiled as dynamic, so requests with any
+        batch size reuse the kernels built here.
+
+        Args:
+            mode: torch.compile mode
+
+        Raises:
+            Exception: If compilation fails. The eager model is kept in that case.
+        """
+        self.model.efficientnet.set_swish(memory_efficient=False)
+
+        model = self.model
+        self.model = compile_module(model, mode=mode)
+
+        try:
+            # Batch 1 is specialized by the compiler, and a second batch size
+            # makes the batch dimension dynamic
+            face = torch.zeros(self.face_size, self.face_size, 3, dtype=torch.uint8)
+            for batch_size in (1, 2):
+                self._predict_batch([face] * batch_size)
+        except Exception:
+            self.model = model
+            raise
+
+    def load_backend(self, backend: str, cache_dir: Optional[str] = None) -> None:
+        """Runs the model with an ONNX Runtime or TensorRT backend.
+
+        Args:
+            backend: Inference backend ('torch', 'onnx' or 'trt')
+            cache_dir: Directory for exported models. Uses the default if None.
+        """
+        # The memory-efficient swish cannot be exported
+        self.model.efficientnet.set_swish(memory_efficient=False)
+
+        example_input = torch.zeros(
+            1, 3, self.face_size, self.face_size, device=self.device
+        )
+        self._load_backend(
+            backend,
+            example_input,
+            cache_key=f"efficientnet:{self.net_model}_{self.train_db}",
+            cache_dir=cache_dir,
         )
 
     def _extract_face_blazeface(self, image: np.ndarray) -> Optional[np.ndarray]:
@@ -179,25 +261,44 @@ class EfficientNetDetector(BaseDeepfakeDetector):
             print(f"BlazeFace extraction failed: {e}")
             return None
 
-    def _preprocess_image(self, image: np.ndarray) -> torch.Tensor:
-        """Preprocesses image for model input.
+    def _preprocess_face(self, image: np.ndarray) -> torch.Tensor:
+        """Extracts and resizes the face in an image.
 
         Args:
             image: Input image as numpy array
 
         Returns:
-            Preprocessed tensor ready for model input
+            uint8 face tensor of shape (face_size, face_size, 3) on CPU
         """
         # Extract face using BlazeFace
         face_image = self._extract_face_blazeface(image)
 
         # Apply transforms
-        tensor = self.transform(image=np.array(face_image))["image"]
+        face = self.transform(image=np.array(face_image))["image"]
+        return torch.from_numpy(np.ascontiguousarray(face, dtype=np.uint8))
+
+    def _predict_batch(self, faces: List[torch.Tensor]) -> List[float]:
+        """Runs the model on a batch of preprocessed faces.
+
+        Args:
+            faces: uint8 face tensors of shape (H, W, C) on CPU
+
+        Returns:
+            Deepfake probability for each face in the batch
+        """
+        with self._inference_lock, torch.inference_mode():
+            batch = self.preprocessor(faces)
+            with self._autocast():
+                output = self.model(batch)
 
-        # Add batch dimension
-        tensor = tensor.unsqueeze(0)
+            # Handle different output formats
+            if isinstance(output, tuple):
+                logits = output[1] if len(output) > 1 else output[0]
+            else:
+                logits = output
 
-        return tensor.to(self.device)
+            # Keep the sigmoid in full precision
+            return torch.sigmoid(logits.float()).view(-1).tolist()
 
     def detect_image(
         self,
@@ -223,29 +324,20 @@ class EfficientNetDetector(BaseDeepfakeDetector):
         image = self._load_image(image_path)
 
         # Preprocess image
-        input_tensor = self._preprocess_image(image)
+        face = self._preprocess_face(image)
 
         # Make prediction
-        with torch.no_grad():
-            output = self.model(input_tensor)
-
-            # Handle different output formats
-            if isinstance(output, tuple):
-                logits = output[1] if len(output) > 1 else output[0]
-            else:
-                logits = output
-
-            prob = torch.sigmoid(logits).item()
-            is_deepfake = prob >= self.confidence_threshold
-            confidence = prob if is_deepfake else (1 - prob)
-            confidence = round(confidence, 2)
-
-            detection = DeepfakeDetection(
-                frame_number=0,  # Single image, so frame 0
-                is_deepfake=is_deepfake,
-                confidence=confidence,
-                model_name=f"{self.net_model}",
-            )
+        prob = self._predict_batch([face])[0]
+        is_deepfake = prob >= self.confidence_threshold
+        confidence = prob if is_deepfake else (1 - prob)
+        confidence = round(confidence, 2)
+
+        detection = DeepfakeDetection(
+            frame_number=0,  # Single image, so frame 0
+            is_deepfake=is_deepfake,
+            confidence=confidence,
+            model_name=f"{self.net_model}",
+        )
 
         # Save to CSV
         if save_csv:
@@ -261,9 +353,12 @@ class EfficientNetDetector(BaseDeepfakeDetector):
         save_annotated: bool = False,
         output_folder: str = "output",
         num_frames: int = 11,
+        batch_size: int = 16,
     ) -> List[DeepfakeDetection]:
         """Detects deepfake in the given video using equally spaced frames.
 
+        Frames are preprocessed on CPU and run through the model in batches.
+
         Args:
             video_path: Path to the input video
             save_csv: Whether to save detection results to CSV file
@@ -271,47 +366,51 @@ class EfficientNetDetector(BaseDeepfakeDetector):
             save_annotated: Whether to save annotated video with results
             output_folder: Folder path where to save annotated videos
             num_frames: Number of equally spaced frames to analyze (default: 11)
+            batch_size: Number of frames per model forward pass (default: 16)
 
         Returns:
             List of DeepfakeDetection objects for analyzed frames
+
+        Raises:
+            ValueError: If batch_size is less than 1
         """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+
         # Extract equally spaced frames
         extracted_frames = self._extract_equally_spaced_frames(video_path, num_frames)
 
-        detections = []
-
+        # Preprocess frames, skipping frames with errors
+        frame_numbers = []
+        faces = []
         for frame_number, frame in extracted_frames:
             try:
-                # Preprocess frame
-                input_tensor = self._preprocess_image(frame)
+                faces.append(self._preprocess_face(frame))
+                frame_numbers.append(frame_number)
+            except Exception as e:
+                print(f"Error processing frame {frame_number}: {e}")
 
-                # Make prediction
-                with torch.no_grad():
-                    output = self.model(input_tensor)
+        detections = []
 
-                    # Handle different output formats
-                    if isinstance(output, tuple):
-                        logits = output[1] if len(output) > 1 else output[0]
-                    else:
-                        logits = output
+        for start in range(0, len(faces), batch_size):
+            # Make predictions for a batch of frames
+            probs = self._predict_batch(faces[start : start + batch_size])
 
-                    prob = torch.sigmoid(logits).item()
-                    is_deepfake = prob >= self.confidence_threshold
-                    confidence = prob if is_deepfake else (1 - prob)
-                    confidence = round(confidence, 2)
+            for frame_number, prob in zip(
+                frame_numbers[start : start + batch_size], probs
+            ):
+                is_deepfake = prob >= self.confidence_threshold
+                confidence = prob if is_deepfake else (1 - prob)
+                confidence = round(confidence, 2)
 
-                    detection = DeepfakeDetection(
+                detections.append(
+                    DeepfakeDetection(
                         frame_number=frame_number,
                         is_deepfake=is_deepfake,
                         confidence=confidence,
                         model_name=f"{self.net_model}",
                     )
-
-                    detections.append(detection)
-
-            except Exception as e:
-                print(f"Error processing frame {frame_number}: {e}")
-                # Skip frames with errors
+                )
 
         # Aggregate results and print final decision
         if detections:
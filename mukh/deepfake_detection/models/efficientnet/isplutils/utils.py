@@ -189,7 +189,11 @@ def make_train_tag(
 
 
 def get_transformer(
-    face_policy: str, patch_size: int, net_normalizer: transforms.Normalize, train: bool
+    face_policy: str,
+    patch_size: int,
+    net_normalizer: transforms.Normalize,
+    train: bool,
+    normalize: bool = True,
 ):
     # Transformers and traindb
     if face_policy == "scale":
@@ -266,14 +270,17 @@ def get_transformer(
     else:
         aug_transformations = []
 
-    # Common final transformations
-    final_transformations = [
-        A.Normalize(
-            mean=net_normalizer.mean,
-            std=net_normalizer.std,
-        ),
-        ToTensorV2(),
-    ]
+    # Common final transformations (skipped when normalizing batches on device)
+    if normalize:
+        final_transformations = [
+            A.Normalize(
+                mean=net_normalizer.mean,
+                std=net_normalizer.std,
+            ),
+            ToTensorV2(),
+        ]
+    else:
+        final_transformations = []
     transf = A.Compose(
         loading_transformations
         + downsample_train_transformations
@@ -8,18 +8,19 @@ LICENSE: Apache License 2.0
 """
 
 import os
-from typing import List
+from typing import List, Optional
 
 import cv2
 import numpy as np
 import torch
-import torch.nn.functional as F
 from facenet_pytorch import MTCNN, InceptionResnetV1
 from PIL import Image
 
+from ....core.jit import compile_module, trace_module
 from ....core.model_hub import download_resnet_inception_model
 from ....core.types import DeepfakeDetection
 from ..base import BaseDeepfakeDetector
+from ..preprocessing import GpuPreprocessor
 
 
 class ResNetInceptionDetector(BaseDeepfakeDetector):
@@ -32,6 +33,7 @@ class ResNetInceptionDetector(BaseDeepfakeDetector):
         device: PyTorch device (CPU/CUDA) for model execution
         mtcnn: MTCNN face detector for preprocessing
         model: InceptionResnetV1 neural network model
+        preprocessor: Batched resizing and scaling on the inference device
         confidence_threshold: Minimum confidence for valid detections
     """
 
@@ -40,6 +42,7 @@ class ResNetInceptionDetector(BaseDeepfakeDetector):
         model_path: str = None,
         confidence_threshold: float = 0.5,
         device: str = None,
+        precision: str = "fp32",
     ):
         """Initializes the ResNet Inception deepfake detector.
 
@@ -47,8 +50,9 @@ class ResNetInceptionDetector(BaseDeepfakeDetector):
             model_path: Path to the trained model checkpoint. If None, downloads from Hugging Face.
             confidence_threshold: Minimum confidence threshold for detections
             device: Device to run inference on ('cpu' or 'cuda'). Auto-detected if None
+            precision: Inference precision ('fp32', 'bf16' or 'fp16')
         """
-        super().__init__(confidence_threshold)
+        super().__init__(confidence_threshold, precision)
 
         # Set device
         if device is None:
@@ -80,6 +84,101 @@ class ResNetInceptionDetector(BaseDeepfakeDetector):
         self.model.load_state_dict(checkpoint["model_state_dict"])
         self.model.to(self.device)
         self.model.eval()
+        self.model_path = model_path
+
+        # Faces are resized to 256x256 and scaled to [0, 1] in batches
+        self.preprocessor = GpuPreprocessor(self.device, size=(256, 256))
+
+    def trace(self, cache_dir: Optional[str] = None) -> None:
+        """Replaces the model with a traced TorchScript module.
+
+        Args:
+            cache_dir: Directory for cached traces. Uses the default if None.
+        """
+        example_input = torch.zeros(1, 3, 256, 256, device=self.device)
+        self.model = trace_module(
+            self.model,
+            example_input,
+            cache_key=f"resnet_inception:{os.path.abspath(self.model_path)}",
+            cache_dir=cache_dir,
+        )
+
+    def compile(self, mode: str = "default") -> None:
+        """Compiles the model with torch.compile and warms it up.
+
+        The batch dimension is compiled as dynamic, so requests with any
+        batch size reuse the kernels built here.
+
+        Args:
+            mode: torch.compile mode
+
+        Raises:
+            Exception: If compilation fails. The eager model is kept in that case.
+        """
+        model = self.model
+        self.model = compile_module(model, mode=mode)
+
+        try:
+            # MTCNN crops are 160x160. Batch 1 is specialized by the compiler,
+            # and a second batch size makes the batch dimension dynamic
+            face = torch.zeros(160, 160, 3, dtype=torch.uint8)
+            for batch_size in (1, 2):
+                self._predict_batch([face] * batch_size)
+        except Exception:
+            self.model = model
+            raise
+
+    def load_backend(self, backend: str, cache_dir: Optional[str] = None) -> None:
+        """Runs the model with an ONNX Runtime or TensorRT backend.
+
+        Args:
+            backend: Inference backend ('torch', 'onnx' or 'trt')
+            cache_dir: Directory for exported models. Uses the default if None.
+        """
+        example_input = torch.zeros(1, 3, 256, 256, device=self.device)
+        self._load_backend(
+            backend,
+            example_input,
+            cache_key=f"resnet_inception:{os.path.abspath(self.model_path)}",
+            weights_path=self.model_path,
+            cache_dir=cache_dir,
+        )
+
+    def _preprocess_face(self, image: Image.Image) -> Optional[torch.Tensor]:
+        """Detects and crops the face in an image.
+
+        Args:
+            image: Input image as RGB PIL Image
+
+        Returns:
+            uint8 face tensor of shape (H, W, 3) on CPU, or None if no face is
+            detected
+        """
+        # MTCNN returns unnormalized (0-255) float pixels in CHW layout
+        face = self.mtcnn(image)
+        if face is None:
+            return None
+
+        # Round rather than truncate when narrowing to uint8
+        return face.round().clamp_(0, 255).permute(1, 2, 0).to("cpu", torch.uint8)
+
+    def _predict_batch(self, faces: List[torch.Tensor]) -> List[float]:
+        """Runs the model on a batch of face crops.
+
+        Args:
+            faces: uint8 face tensors of shape (H, W, 3) on CPU
+
+        Returns:
+            Deepfake probability for each face in the batch
+        """
+        with self._inference_lock, torch.inference_mode():
+            batch = self.preprocessor(faces)
+
+            with self._autocast():
+                logits = self.model(batch)
+
+            # Keep the sigmoid in full precision
+            return torch.sigmoid(logits.float()).view(-1).tolist()
 
     def detect_image(
         self,
@@ -109,39 +208,22 @@ class ResNetInceptionDetector(BaseDeepfakeDetector):
         input_image = Image.open(image_path).convert("RGB")
 
         # Detect face in the image
-        face = self.mtcnn(input_image)
+        face = self._preprocess_face(input_image)
         if face is None:
             raise ValueError("No face detected in the image")
 
-        # Prepare face tensor
-        face = face.unsqueeze(0)  # add batch dimension
-        face = F.interpolate(
-            face, size=(256, 256), mode="bilinear", align_corners=False
-        )
-
-        # Convert face to numpy for visualization
-        prev_face = face.squeeze(0).permute(1, 2, 0).cpu().detach().int().numpy()
-        prev_face = prev_face.astype("uint8")
-
-        # Normalize face for model input
-        face = face.to(self.device)
-        face = face.to(torch.float32)
-        face = face / 255.0
-        face_image_to_plot = face.squeeze(0).permute(1, 2, 0).cpu().detach().numpy()
-
         # Make prediction
-        with torch.no_grad():
-            output = torch.sigmoid(self.model(face).squeeze(0))
-            is_deepfake = output.item() >= self.confidence_threshold
-            confidence = output.item() if is_deepfake else (1 - output.item())
-            confidence = round(confidence, 2)
-
-            detection = DeepfakeDetection(
-                frame_number=0,  # Single image, so frame 0
-                is_deepfake=is_deepfake,
-                confidence=confidence,
-                model_name="ResNetInception",
-            )
+        prob = self._predict_batch([face])[0]
+        is_deepfake = prob >= self.confidence_threshold
+        confidence = prob if is_deepfake else (1 - prob)
+        confidence = round(confidence, 2)
+
+        detection = DeepfakeDetection(
+            frame_number=0,  # Single image, so frame 0
+            is_deepfake=is_deepfake,
+            confidence=confidence,
+            model_name="ResNetInception",
+        )
 
         if save_annotated:
             self._save_annotated_image(image, detection, image_path, output_folder)
@@ -160,9 +242,12 @@ class ResNetInceptionDetector(BaseDeepfakeDetector):
         save_annotated: bool = False,
         output_folder: str = "output",
         num_frames: int = 11,
+        batch_size: int = 16,
     ) -> List[DeepfakeDetection]:
         """Detects deepfake in the given video using equally spaced frames.
 
+        Faces are extracted from each frame and run through the model in batches.
+
         Args:
             video_path: Path to the input video
             save_csv: Whether to save detection results to CSV file
@@ -170,57 +255,55 @@ class ResNetInceptionDetector(BaseDeepfakeDetector):
             save_annotated: Whether to save annotated video with results
             output_folder: Folder path where to save annotated videos
             num_frames: Number of equally spaced frames to analyze (default: 11)
+            batch_size: Number of frames per model forward pass (default: 16)
 
         Returns:
             List of DeepfakeDetection objects for analyzed frames
+
+        Raises:
+            ValueError: If batch_size is less than 1
         """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+
         # Extract equally spaced frames
         extracted_frames = self._extract_equally_spaced_frames(video_path, num_frames)
 
-        detections = []
-
+        # Extract faces, skipping frames with errors (e.g., no face detected)
+        frame_numbers = []
+        faces = []
         for frame_number, frame in extracted_frames:
             try:
-                # Convert frame to PIL Image
                 frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(frame_rgb)
-
-                # Detect face in the frame
-                face = self.mtcnn(pil_image)
+                face = self._preprocess_face(Image.fromarray(frame_rgb))
                 if face is not None:
-                    # Prepare face tensor
-                    face = face.unsqueeze(0)
-                    face = F.interpolate(
-                        face, size=(256, 256), mode="bilinear", align_corners=False
-                    )
-
-                    # Normalize face for model input
-                    face = face.to(self.device)
-                    face = face.to(torch.float32)
-                    face = face / 255.0
-
-                    # Make prediction
-                    with torch.no_grad():
-                        output = torch.sigmoid(self.model(face).squeeze(0))
-                        is_deepfake = output.item() >= self.confidence_threshold
-                        confidence = (
-                            output.item() if is_deepfake else (1 - output.item())
-                        )
-                        confidence = round(confidence, 2)
-
-                        detection = DeepfakeDetection(
-                            frame_number=frame_number,
-                            is_deepfake=is_deepfake,
-                            confidence=confidence,
-                            model_name="ResNetInception",
-                        )
-
-                        detections.append(detection)
-
+                    faces.append(face)
+                    frame_numbers.append(frame_number)
             except Exception as e:
-                # Skip frames with errors (e.g., no face detected)
                 pass
 
+        detections = []
+
+        for start in range(0, len(faces), batch_size):
+            # Make predictions for a batch of frames
+            probs = self._predict_batch(faces[start : start + batch_size])
+
+            for frame_number, prob in zip(
+                frame_numbers[start : start + batch_size], probs
+            ):
+                is_deepfake = prob >= self.confidence_threshold
+                confidence = prob if is_deepfake else (1 - prob)
+                confidence = round(confidence, 2)
+
+                detections.append(
+                    DeepfakeDetection(
+                        frame_number=frame_number,
+                        is_deepfake=is_deepfake,
+                        confidence=confidence,
+                        model_name="ResNetInception",
+                    )
+                )
+
         # Aggregate results and print final decision
         if detections:
             final_result, deepfake_count, total_frames = (
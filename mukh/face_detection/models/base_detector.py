@@ -10,13 +10,13 @@ import platform
 import warnings
 from abc import ABC, abstractmethod
 from functools import partial
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
 from tqdm import tqdm
 
-from ...core.types import FaceDetection
+from ...core.types import BoundingBox, FaceDetection
 
 
 def _process_single_image_for_batch_worker(args_tuple: tuple) -> List[dict]:
@@ -86,12 +86,34 @@ def _process_single_image_for_batch_worker(args_tuple: tuple) -> List[dict]:
         return []
 
 
+def _tile_origins(length: int, tile_size: int, stride: int) -> List[int]:
+    """Computes tile start offsets covering an image axis.
+
+    Args:
+        length: Length of the image axis in pixels
+        tile_size: Tile length in pixels
+        stride: Distance between consecutive tile starts
+
+    Returns:
+        List of tile start offsets. The last tile ends at the image border.
+    """
+    if length <= tile_size:
+        return [0]
+
+    origins = list(range(0, length - tile_size, stride))
+    origins.append(length - tile_size)
+    return origins
+
+
 class BaseFaceDetector(ABC):
     """Abstract base class for face detector implementations.
 
     All face detector implementations must inherit from this class and implement
     the required abstract methods.
 
+    Implementations are expected to set an ``input_size`` attribute with the
+    side length, in pixels, of the images the model runs on.
+
     Attributes:
         confidence_threshold: Float threshold (0-1) for detection confidence.
     """
@@ -126,6 +148,212 @@ class BaseFaceDetector(ABC):
 
         return image
 
+    @abstractmethod
+    def _detect_image(self, image: np.ndarray) -> List[FaceDetection]:
+        """Detects faces in a loaded image.
+
+        Args:
+            image: Input image in BGR format.
+
+        Returns:
+            List of FaceDetection objects in image coordinates.
+        """
+        pass
+
+    def detect_batch(self, images: List[np.ndarray]) -> List[List[FaceDetection]]:
+        """Detects faces in several loaded images.
+
+        Implementations that can run the model on a batch override this to do
+        a single forward pass.
+
+        Args:
+            images: Input images in BGR format.
+
+        Returns:
+            List of detections for each image.
+        """
+        return [self._detect_image(image) for image in images]
+
+    def detect_tiled(
+        self,
+        image_path: str,
+        tile_size: Optional[int] = None,
+        overlap: float = 0.15,
+        iou_threshold: float = 0.3,
+        save_json: bool = True,
+        json_path: str = "detections.json",
+        save_annotated: bool = False,
+        output_folder: str = "output",
+    ) -> List[FaceDetection]:
+        """Detects faces in a large image by splitting it into overlapping tiles.
+
+        The whole image and every tile are run as one batch, so faces too
+        small to survive downscaling the full image are still found. Boxes are
+        mapped back to image coordinates and merged with non-maximum
+        suppression. Images that fit in a single tile use the regular path.
+
+        Args:
+            image_path: Path to the input image.
+            tile_size: Tile side length in pixels. Defaults to twice the model
+                input size.
+            overlap: Fraction of the tile size shared by neighbouring tiles.
+            iou_threshold: IoU above which overlapping boxes are merged.
+            save_json: Whether to save detection results to JSON file, defaults to True.
+            json_path: Path where to save the JSON file.
+            save_annotated: Whether to save annotated image with bounding boxes.
+            output_folder: Folder path where to save annotated images.
+
+        Returns:
+            List of FaceDetection objects containing detected faces.
+
+        Raises:
+            ValueError: If overlap is not in [0, 1).
+        """
+        image = self._load_image(image_path)
+        faces = self._detect_tiled(image, tile_size, overlap, iou_threshold)
+
+        if save_json:
+            self._save_detections_to_json(faces, image_path, json_path)
+
+        if save_annotated:
+            self._save_annotated_image(image, faces, image_path, output_folder)
+
+        return faces
+
+    def detect_ndarray(
+        self,
+        image: np.ndarray,
+        image_name: str = "image.png",
+        tile: bool = False,
+        save_json: bool = True,
+        json_path: str = "detections.json",
+        save_annotated: bool = False,
+        output_folder: str = "output",
+    ) -> List[FaceDetection]:
+        """Detects faces in an image that is already in memory.
+
+        Args:
+            image: Input image in BGR format.
+            image_name: File name recorded in the JSON output and used to name
+                the annotated image.
+            tile: Whether to detect on overlapping tiles, as in detect_tiled.
+            save_json: Whether to save detection results to JSON file, defaults to True.
+            json_path: Path where to save the JSON file.
+            save_annotated: Whether to save annotated image with bounding boxes.
+            output_folder: Folder path where to save annotated images.
+
+        Returns:
+            List of FaceDetection objects containing detected faces.
+        """
+        if tile:
+            faces = self._detect_tiled(image)
+        else:
+            faces = self._detect_image(image)
+
+        if save_json:
+            self._save_detections_to_json(faces, image_name, json_path)
+
+        if save_annotated:
+            self._save_annotated_image(image, faces, image_name, output_folder)
+
+        return faces
+
+    def _detect_tiled(
+        self,
+        image: np.ndarray,
+        tile_size: Optional[int] = None,
+        overlap: float = 0.15,
+        iou_threshold: float = 0.3,
+    ) -> List[FaceDetection]:
+        """Detects faces in a loaded image using overlapping tiles.
+
+        Args:
+            image: Input image in BGR format.
+            tile_size: Tile side length in pixels. Defaults to twice the model
+                input size.
+            overlap: Fraction of the tile size shared by neighbouring tiles.
+            iou_threshold: IoU above which overlapping boxes are merged.
+
+        Returns:
+            List of FaceDetection objects in image coordinates.
+
+        Raises:
+            ValueError: If overlap is not in [0, 1).
+        """
+        if not 0.0 <= overlap < 1.0:
+            raise ValueError(f"overlap must be in [0, 1), got {overlap}")
+
+        height, width = image.shape[:2]
+        tile_size = tile_size or 2 * self.input_size
+
+        if height <= tile_size and width <= tile_size:
+            faces = self._detect_image(image)
+        else:
+            stride = max(1, int(tile_size * (1.0 - overlap)))
+            origins = [(0, 0)] + [
+                (x, y)
+                for y in _tile_origins(height, tile_size, stride)
+                for x in _tile_origins(width, tile_size, stride)
+            ]
+            tiles = [image] + [
+                np.ascontiguousarray(image[y : y + tile_size, x : x + tile_size])
+                for x, y in origins[1:]
+            ]
+
+            faces = self._merge_detections(
+                self.detect_batch(tiles), origins, iou_threshold
+            )
+
+        return faces
+
+    def _merge_detections(
+        self,
+        detections: List[List[FaceDetection]],
+        origins: List[Tuple[int, int]],
+        iou_threshold: float,
+    ) -> List[FaceDetection]:
+        """Maps per-tile detections to image coordinates and merges duplicates.
+
+        Args:
+            detections: Detections for each tile, in tile coordinates.
+            origins: (x, y) offset of each tile in the image.
+            iou_threshold: IoU above which overlapping boxes are merged.
+
+        Returns:
+            Merged detections in image coordinates, highest confidence first.
+        """
+        faces = []
+        for tile_faces, (x0, y0) in zip(detections, origins):
+            for face in tile_faces:
+                bbox = face.bbox
+                landmarks = face.landmarks
+                if landmarks is not None:
+                    landmarks = landmarks + np.array([x0, y0])
+                faces.append(
+                    FaceDetection(
+                        bbox=BoundingBox(
+                            x1=bbox.x1 + x0,
+                            y1=bbox.y1 + y0,
+                            x2=bbox.x2 + x0,
+                            y2=bbox.y2 + y0,
+                            confidence=bbox.confidence,
+                        ),
+                        landmarks=landmarks,
+                    )
+                )
+
+        if not faces:
+            return faces
+
+        boxes = [
+            [int(f.bbox.x1), int(f.bbox.y1), int(f.bbox.width), int(f.bbox.height)]
+            for f in faces
+        ]
+        scores = [float(f.bbox.confidence) for f in faces]
+        keep = cv2.dnn.NMSBoxes(boxes, scores, 0.0, iou_threshold)
+
+        return [faces[i] for i in np.array(keep).flatten()]
+
     @abstractmethod
     def detect(
         self,
@@ -468,6 +696,19 @@ class BaseFaceDetector(ABC):
 
         return image_copy
 
+    def get_annotated_path(self, image_path: str, output_folder: str) -> str:
+        """Returns the path the annotated version of an image is saved to.
+
+        Args:
+            image_path: Path to the original image
+            output_folder: Folder where annotated images are saved
+
+        Returns:
+            str: Path of the annotated image, ``<name>_detected<ext>``
+        """
+        name, ext = os.path.splitext(os.path.basename(image_path))
+        return os.path.join(output_folder, f"{name}_detected{ext}")
+
     def _save_annotated_image(
         self,
         image: np.ndarray,
@@ -489,15 +730,11 @@ class BaseFaceDetector(ABC):
         # Create output directory if it doesn't exist
         os.makedirs(output_folder, exist_ok=True)
 
+        output_path = self.get_annotated_path(image_path, output_folder)
+
         # Draw detections on image
         annotated_image = self._draw_detections(image, faces)
 
-        # Create output filename
-        image_name = os.path.basename(image_path)
-        name, ext = os.path.splitext(image_name)
-        output_filename = f"{name}_detected{ext}"
-        output_path = os.path.join(output_folder, output_filename)
-
         # Save annotated image
         cv2.imwrite(output_path, annotated_image)
 
@@ -65,6 +65,68 @@ class BlazeFaceDetector(BaseFaceDetector):
 
         # Set minimum score threshold
         self.net.min_score_thresh = confidence_threshold
+        self.input_size = 128
+
+    def _detect_image(self, image: np.ndarray) -> List[FaceDetection]:
+        """Detects faces in a loaded image.
+
+        Args:
+            image: Input image in BGR format.
+
+        Returns:
+            List[FaceDetection]: Detected faces in image coordinates.
+        """
+        return self.detect_batch([image])[0]
+
+    def detect_batch(self, images: List[np.ndarray]) -> List[List[FaceDetection]]:
+        """Detects faces in several images with a single forward pass.
+
+        Each image is resized to 128x128 pixels for inference and the results
+        are scaled back to its original size.
+
+        Args:
+            images: Input images in BGR format.
+
+        Returns:
+            List[List[FaceDetection]]: Detected faces for each image.
+        """
+        # Resize to 128x128 and convert BGR to RGB
+        batch = np.stack(
+            [
+                cv2.cvtColor(cv2.resize(image, (128, 128)), cv2.COLOR_BGR2RGB)
+                for image in images
+            ]
+        )
+
+        # Get detections, with NMS applied to filter overlapping detections
+        detections = self.net.predict_on_batch(batch, apply_nms=True)
+
+        results = []
+        for image, image_detections in zip(images, detections):
+            orig_h, orig_w = image.shape[:2]
+
+            # Convert to FaceDetection objects
+            faces = []
+            for detection in image_detections:
+                # Convert normalized coordinates back to original image size
+                x1 = float(detection[1]) * orig_w  # xmin
+                y1 = float(detection[0]) * orig_h  # ymin
+                x2 = float(detection[3]) * orig_w  # xmax
+                y2 = float(detection[2]) * orig_h  # ymax
+
+                bbox = BoundingBox(
+                    x1=int(x1),
+                    y1=int(y1),
+                    x2=int(x2),
+                    y2=int(y2),
+                    confidence=detection[16].item(),
+                )
+
+                faces.append(FaceDetection(bbox=bbox))
+
+            results.append(faces)
+
+        return results
 
     def detect(
         self,
@@ -94,43 +156,7 @@ class BlazeFaceDetector(BaseFaceDetector):
         # Load image from path
         image = self._load_image(image_path)
 
-        # Get original dimensions
-        orig_h, orig_w = image.shape[:2]
-
-        # Resize to 128x128
-        image_resized = cv2.resize(image, (128, 128))
-
-        # Convert BGR to RGB
-        image_rgb = cv2.cvtColor(image_resized, cv2.COLOR_BGR2RGB)
-
-        # Get detections
-        detections = self.net.predict_on_image(image_rgb)
-
-        # Apply NMS to filter overlapping detections
-        if len(detections) > 0:
-            # Convert to batch format for NMS
-            detections_batch = [detections]
-            filtered_detections = self.net.nms(detections_batch)
-            detections = filtered_detections[0]
-
-        # Convert to FaceDetection objects
-        faces = []
-        for detection in detections:
-            # Convert normalized coordinates back to original image size
-            x1 = float(detection[1]) * orig_w  # xmin
-            y1 = float(detection[0]) * orig_h  # ymin
-            x2 = float(detection[3]) * orig_w  # xmax
-            y2 = float(detection[2]) * orig_h  # ymax
-
-            bbox = BoundingBox(
-                x1=int(x1),
-                y1=int(y1),
-                x2=int(x2),
-                y2=int(y2),
-                confidence=detection[16].item(),
-            )
-
-            faces.append(FaceDetection(bbox=bbox))
+        faces = self._detect_image(image)
 
         # Save to JSON if requested
         if save_json:
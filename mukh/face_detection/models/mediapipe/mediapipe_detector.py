@@ -6,6 +6,7 @@ Source: https://github.com/google-ai-edge/mediapipe
 LICENSE: Apache License 2.0
 """
 
+import threading
 from typing import List, Tuple
 
 import cv2
@@ -24,7 +25,8 @@ class MediaPipeFaceDetector(BaseFaceDetector):
 
     Attributes:
         mp_face_detection: MediaPipe face detection solution
-        face_detection: Configured face detector instance
+        face_detection: Configured face detector instance. Its graph is not
+            thread-safe, so calls are serialized.
         confidence_threshold: Minimum confidence for valid detections
     """
 
@@ -41,37 +43,26 @@ class MediaPipeFaceDetector(BaseFaceDetector):
             min_detection_confidence=confidence_threshold,
             model_selection=model_selection,
         )
+        self._process_lock = threading.Lock()
 
-    def detect(
-        self,
-        image_path: str,
-        save_json: bool = True,
-        json_path: str = "detections.json",
-        save_annotated: bool = False,
-        output_folder: str = "output",
-    ) -> List[FaceDetection]:
-        """Detects faces in the given image using MediaPipe.
+        # Short-range model runs on 128x128 inputs, full-range on 192x192
+        self.input_size = 128 if model_selection == 0 else 192
+
+    def _detect_image(self, image: np.ndarray) -> List[FaceDetection]:
+        """Detects faces in a loaded image.
 
         Args:
-            image_path: Path to the input image.
-            save_json: Whether to save detection results to JSON file, defaults to True.
-            json_path: Path where to save the JSON file.
-            save_annotated: Whether to save annotated image with bounding boxes.
-            output_folder: Folder path where to save annotated images.
+            image: Input image in BGR format.
 
         Returns:
-            List[FaceDetection]: List of detected faces, each containing:
-                - bbox: BoundingBox with coordinates and confidence
-                - landmarks: Array of 6 facial keypoints
+            List[FaceDetection]: Detected faces in image coordinates.
         """
-        # Load image from path
-        image = self._load_image(image_path)
-
         # Convert BGR to RGB
         image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
         # Process image
-        results = self.face_detection.process(image_rgb)
+        with self._process_lock:
+            results = self.face_detection.process(image_rgb)
 
         faces = []
         if results.detections:
@@ -91,6 +82,35 @@ class MediaPipeFaceDetector(BaseFaceDetector):
 
                 faces.append(FaceDetection(bbox=bbox))
 
+        return faces
+
+    def detect(
+        self,
+        image_path: str,
+        save_json: bool = True,
+        json_path: str = "detections.json",
+        save_annotated: bool = False,
+        output_folder: str = "output",
+    ) -> List[FaceDetection]:
+        """Detects faces in the given image using MediaPipe.
+
+        Args:
+            image_path: Path to the input image.
+            save_json: Whether to save detection results to JSON file, defaults to True.
+            json_path: Path where to save the JSON file.
+            save_annotated: Whether to save annotated image with bounding boxes.
+            output_folder: Folder path where to save annotated images.
+
+        Returns:
+            List[FaceDetection]: List of detected faces, each containing:
+                - bbox: BoundingBox with coordinates and confidence
+                - landmarks: Array of 6 facial keypoints
+        """
+        # Load image from path
+        image = self._load_image(image_path)
+
+        faces = self._detect_image(image)
+
         # Save to JSON if requested
         if save_json:
             self._save_detections_to_json(faces, image_path, json_path)
@@ -101,6 +101,70 @@ class UltralightDetector(BaseFaceDetector):
         # Load model weights
         self.net.load(weights_path)
 
+    def _detect_image(self, image: np.ndarray) -> List[FaceDetection]:
+        """Detects faces in a loaded image.
+
+        Args:
+            image: Input image in BGR format.
+
+        Returns:
+            List[FaceDetection]: Detected faces in image coordinates.
+        """
+        return self.detect_batch([image])[0]
+
+    def detect_batch(self, images: List[np.ndarray]) -> List[List[FaceDetection]]:
+        """Detects faces in several images with a single forward pass.
+
+        Each image is resized to self.input_size for inference and the results
+        are scaled back to its original size.
+
+        Args:
+            images: Input images in BGR format.
+
+        Returns:
+            List[List[FaceDetection]]: Detected faces for each image.
+        """
+        # Resize images to input size and convert BGR to RGB
+        batch = [
+            cv2.cvtColor(
+                cv2.resize(image, (self.input_size, self.input_size)),
+                cv2.COLOR_BGR2RGB,
+            )
+            for image in images
+        ]
+
+        # Get detections
+        predictions = self.predictor.predict_batch(
+            batch, self.candidate_size / 2, self.confidence_threshold
+        )
+
+        results = []
+        for image, (boxes, _, probs) in zip(images, predictions):
+            orig_height, orig_width = image.shape[:2]
+
+            # Scale factors for converting back to original size
+            width_scale = orig_width / self.input_size
+            height_scale = orig_height / self.input_size
+
+            # Convert to FaceDetection objects
+            faces = []
+            for i in range(boxes.size(0)):
+                box = boxes[i, :].int().tolist()
+                # Scale bounding box back to original image size
+                bbox = BoundingBox(
+                    x1=int(box[0] * width_scale),
+                    y1=int(box[1] * height_scale),
+                    x2=int(box[2] * width_scale),
+                    y2=int(box[3] * height_scale),
+                    confidence=probs[i].item(),
+                )
+                # Ultralight doesn't provide landmarks, so we pass None
+                faces.append(FaceDetection(bbox=bbox))
+
+            results.append(faces)
+
+        return results
+
     def detect(
         self,
         image_path: str,
@@ -128,37 +192,8 @@ class UltralightDetector(BaseFaceDetector):
         """
         # Load image from path
         image = self._load_image(image_path)
-        orig_height, orig_width = image.shape[:2]
 
-        # Resize image to input size
-        resized_image = cv2.resize(image, (self.input_size, self.input_size))
-
-        # Convert BGR to RGB
-        image_rgb = cv2.cvtColor(resized_image, cv2.COLOR_BGR2RGB)
-
-        # Get detections
-        boxes, labels, probs = self.predictor.predict(
-            image_rgb, self.candidate_size / 2, self.confidence_threshold
-        )
-
-        # Scale factors for converting back to original size
-        width_scale = orig_width / self.input_size
-        height_scale = orig_height / self.input_size
-
-        # Convert to FaceDetection objects
-        faces = []
-        for i in range(boxes.size(0)):
-            box = boxes[i, :].int().tolist()
-            # Scale bounding box back to original image size
-            bbox = BoundingBox(
-                x1=int(box[0] * width_scale),
-                y1=int(box[1] * height_scale),
-                x2=int(box[2] * width_scale),
-                y2=int(box[3] * height_scale),
-                confidence=probs[i].item(),
-            )
-            # Ultralight doesn't provide landmarks, so we pass None
-            faces.append(FaceDetection(bbox=bbox))
+        faces = self._detect_image(image)
 
         # Save to JSON if requested
         if save_json:
@@ -47,23 +47,26 @@ class Predictor:
         self.timer = Timer()
 
     def predict(self, image, top_k=-1, prob_threshold=None):
-        cpu_device = torch.device("cpu")
-        height, width, _ = image.shape
-        image = self.transform(image)
-        images = image.unsqueeze(0)
-        images = images.to(self.device)
+        return self.predict_batch([image], top_k, prob_threshold)[0]
+
+    def predict_batch(self, images, top_k=-1, prob_threshold=None):
+        """Runs a single forward pass over images of the same size."""
+        height, width, _ = images[0].shape
+        batch = torch.stack([self.transform(image) for image in images])
+        batch = batch.to(self.device)
         with torch.no_grad():
-            for i in range(1):
-                self.timer.start()
-                scores, boxes = self.net.forward(images)
-                # print("Inference time: ", self.timer.end())
-        boxes = boxes[0]
-        scores = scores[0]
+            scores, boxes = self.net.forward(batch)
+        # this version of nms is slower on GPU, so we move data to CPU.
+        boxes = boxes.cpu()
+        scores = scores.cpu()
+        return [
+            self._filter(boxes[i], scores[i], width, height, top_k, prob_threshold)
+            for i in range(len(images))
+        ]
+
+    def _filter(self, boxes, scores, width, height, top_k, prob_threshold):
         if not prob_threshold:
             prob_threshold = self.filter_threshold
-        # this version of nms is slower on GPU, so we move data to CPU.
-        boxes = boxes.to(cpu_device)
-        scores = scores.to(cpu_device)
         picked_box_probs = []
         picked_labels = []
         for class_index in range(1, scores.size(1)):
@@ -14,13 +14,38 @@ result = detector.detect("path/to/media", "path/to/output")
 
 import argparse
 import os
-from typing import Dict, List, Optional, Tuple
+import string
+import threading
+from typing import Dict, List, Literal, Optional, Tuple
 
 import pandas as pd
 import torch
 
+from mukh.core.backends import BACKENDS
 from mukh.deepfake_detection import DeepfakeDetector
 
+BackendType = Literal["torch", "onnx", "trt"]
+
+# Report written to pipeline_result.txt, built once per process
+_RESULT_TEMPLATE = string.Template(
+    "Final Ensemble Result: $verdict\n"
+    "Deepfake frames: $deepfake_frames/$total_frames\n"
+    "Average confidence: $confidence\n"
+    "Model configurations: $model_configs\n"
+    "Models run: $models_run\n"
+)
+_VERDICTS = ("REAL", "DEEPFAKE")
+
+# Relative inference cost of each model, used to run cheap models first
+MODEL_COSTS = {"efficientnet": 1.0, "resnet_inception": 3.5}
+
+# Loaded detectors shared by every pipeline in the process, keyed by model name
+# and the settings that change how the model is loaded (device, precision,
+# backend, compile, jit). Ensemble weights and thresholds are not part of the
+# key, so pipelines that differ only in those reuse the same models.
+_detector_cache: Dict[Tuple[str, str, str, str, bool, bool], DeepfakeDetector] = {}
+_detector_cache_lock = threading.Lock()
+
 
 class PipelineDeepfakeDetection:
     """Deepfake detection pipeline that combines multiple models with weighted averaging.
@@ -32,6 +57,12 @@ class PipelineDeepfakeDetection:
         model_configs: Dictionary mapping model names to their weights
         device: PyTorch device for model execution
         confidence_threshold: Threshold for ensemble prediction
+        use_jit: Whether models are traced to TorchScript when loaded
+        use_compile: Whether models are compiled with torch.compile when loaded
+        precision: Inference precision of the models ('fp32', 'bf16' or 'fp16')
+        backend: Inference backend of the models ('torch', 'onnx' or 'trt')
+        detectors: Loaded detectors keyed by model name, shared with other
+            pipelines that load the same model with the same settings
     """
 
     def __init__(
@@ -39,6 +70,10 @@ class PipelineDeepfakeDetection:
         model_configs: Dict[str, float],
         device: Optional[str] = None,
         confidence_threshold: float = 0.5,
+        use_jit: bool = False,
+        use_compile: bool = False,
+        precision: str = "fp32",
+        backend: BackendType = "torch",
     ):
         """Initialize the ensemble deepfake detector.
 
@@ -47,9 +82,23 @@ class PipelineDeepfakeDetection:
                           e.g., {"resnet_inception": 0.5, "efficientnet": 0.5}
             device: Device to run inference on ('cpu' or 'cuda'). Auto-detected if None
             confidence_threshold: Threshold for ensemble prediction (default: 0.5)
+            use_jit: Whether to trace models to TorchScript when they are
+                first loaded (default: False)
+            use_compile: Whether to compile models with torch.compile when they
+                are first loaded. Takes precedence over use_jit, which is used
+                as the fallback if compilation fails (default: False)
+            precision: Inference precision ('fp32', 'bf16' or 'fp16'). Half
+                precisions only apply on CUDA devices (default: 'fp32')
+            backend: Inference backend ('torch', 'onnx' or 'trt'). The ONNX
+                Runtime and TensorRT backends fall back to PyTorch if they
+                cannot be loaded (default: 'torch')
         """
         self.model_configs = model_configs
         self.confidence_threshold = confidence_threshold
+        self.use_jit = use_jit
+        self.use_compile = use_compile
+        self.precision = precision
+        self.backend = backend
 
         # Set device
         if device is None:
@@ -60,6 +109,9 @@ class PipelineDeepfakeDetection:
         # Validate model configurations
         self._validate_model_configs()
 
+        # Detectors are created lazily and reused across detect() calls
+        self.detectors: Dict[str, DeepfakeDetector] = {}
+
     def _validate_model_configs(self) -> None:
         """Validate model configurations.
 
@@ -69,6 +121,11 @@ class PipelineDeepfakeDetection:
         if not self.model_configs:
             raise ValueError("Model configurations cannot be empty")
 
+        if self.backend not in BACKENDS:
+            raise ValueError(
+                f"Invalid backend: {self.backend}. Valid backends: {list(BACKENDS)}"
+            )
+
         valid_models = {"resnet_inception", "efficientnet"}
         for model_name in self.model_configs.keys():
             if model_name not in valid_models:
@@ -81,20 +138,107 @@ class PipelineDeepfakeDetection:
         if total_weight <= 0:
             raise ValueError("Total weight must be positive")
 
+    def _get_detector(self, model_name: str) -> DeepfakeDetector:
+        """Get the detector for a model, loading it on first use.
+
+        Detectors are shared between pipelines through a process-wide cache.
+        Loading is serialized so concurrent first calls build the model once.
+
+        Args:
+            model_name: Name of the deepfake detection model
+
+        Returns:
+            The loaded detector for the model
+        """
+        key = (
+            model_name,
+            str(self.device),
+            self.precision,
+            self.backend,
+            self.use_compile,
+            self.use_jit,
+        )
+        with _detector_cache_lock:
+            detector = _detector_cache.get(key)
+            if detector is None:
+                detector = self._load_detector(model_name)
+                _detector_cache[key] = detector
+
+        self.detectors[model_name] = detector
+        return detector
+
+    def _load_detector(self, model_name: str) -> DeepfakeDetector:
+        """Load a detector and apply the configured backend or optimization.
+
+        Args:
+            model_name: Name of the deepfake detection model
+
+        Returns:
+            The loaded detector for the model
+        """
+        detector = DeepfakeDetector(
+            model_name=model_name,
+            confidence_threshold=0.5,  # Use default threshold for individual models
+            device=self.device,
+            precision=self.precision,
+        )
+
+        optimized = False
+        if self.backend != "torch":
+            try:
+                detector.load_backend(self.backend)
+                optimized = True
+            except Exception as e:
+                print(f"Loading {self.backend} backend failed for {model_name}: {e}")
+
+        if self.use_compile and not optimized:
+            try:
+                detector.compile()
+                optimized = True
+            except Exception as e:
+                print(f"torch.compile failed for {model_name}: {e}")
+
+        if self.use_jit and not optimized:
+            try:
+                detector.trace()
+            except Exception as e:
+                print(f"TorchScript tracing failed for {model_name}: {e}")
+
+        return detector
+
+    def load_models(self) -> None:
+        """Load, optimize and warm up every configured model.
+
+        Call this at startup so the first detect() call does not pay for
+        loading, tracing or compiling the models.
+        """
+        for model_name in self.model_configs:
+            self._get_detector(model_name)
+
     def _run_individual_models(
         self,
         media_path: str,
         output_folder: str,
         save_csv: bool = True,
         num_frames: int = 11,
+        batch_size: int = 16,
+        early_exit_margin: Optional[float] = None,
     ) -> Tuple[List[pd.DataFrame], bool]:
         """Run individual deepfake detection models.
 
+        Models run from cheapest to most expensive. With an early exit margin,
+        the remaining models are skipped once the weighted mean deepfake
+        probability of the models run so far is further than the margin from
+        the confidence threshold.
+
         Args:
             media_path: Path to the media file (image or video) to analyze
             output_folder: Folder path to save all outputs
             save_csv: Whether to save individual model results to CSV
             num_frames: Number of equally spaced frames for video analysis
+            batch_size: Number of video frames per model forward pass
+            early_exit_margin: Margin for skipping the remaining models. Runs
+                every model if None.
 
         Returns:
             Tuple of (list of detection dataframes, success flag)
@@ -104,17 +248,25 @@ class PipelineDeepfakeDetection:
 
         detection_dataframes = []
 
+        model_configs = sorted(
+            self.model_configs.items(), key=lambda item: MODEL_COSTS[item[0]]
+        )
+        completed_weight = 0.0
+        running_score = 0.0
+
         # Run each model and save results
-        for model_name, weight in self.model_configs.items():
+        for model_name, weight in model_configs:
+            if early_exit_margin is not None and completed_weight > 0:
+                score = running_score / completed_weight
+                if abs(score - self.confidence_threshold) > early_exit_margin:
+                    print(f"Early exit: skipping {model_name} and remaining models")
+                    break
+
             print(f"Running {model_name} model...")
 
             try:
-                # Create detector
-                detector = DeepfakeDetector(
-                    model_name=model_name,
-                    confidence_threshold=0.5,  # Use default threshold for individual models
-                    device=self.device,
-                )
+                # Get (cached) detector
+                detector = self._get_detector(model_name)
 
                 # Set up CSV path for this model
                 csv_path = os.path.join(output_folder, f"{model_name}_detections.csv")
@@ -127,8 +279,21 @@ class PipelineDeepfakeDetection:
                     save_annotated=False,  # Don't save annotated media for individual models
                     output_folder=output_folder,
                     num_frames=num_frames,
+                    batch_size=batch_size,
                 )
 
+                # Mean deepfake probability of this run across frames, taken
+                # from the returned detections since the CSV is appended to
+                if not isinstance(detections, list):
+                    detections = [detections]
+                deepfake_probs = [
+                    d.confidence if d.is_deepfake else 1.0 - d.confidence
+                    for d in detections
+                ]
+                if deepfake_probs:
+                    running_score += weight * sum(deepfake_probs) / len(deepfake_probs)
+                    completed_weight += weight
+
                 # Load the saved CSV into a dataframe
                 if save_csv and os.path.exists(csv_path):
                     df = pd.read_csv(csv_path)
@@ -215,18 +380,24 @@ class PipelineDeepfakeDetection:
         total_frames = len(ensemble_df)
         final_result = deepfake_frames > (total_frames / 2)
 
+        verdict = _VERDICTS[bool(final_result)]
+
         # Save final result to text file
         result_txt_path = os.path.join(output_folder, "pipeline_result.txt")
         with open(result_txt_path, "w") as f:
             f.write(
-                f"Final Ensemble Result: {'DEEPFAKE' if final_result else 'REAL'}\n"
+                _RESULT_TEMPLATE.substitute(
+                    verdict=verdict,
+                    deepfake_frames=deepfake_frames,
+                    total_frames=total_frames,
+                    confidence=f"{ensemble_df['confidence'].mean():.4f}",
+                    model_configs=self.model_configs,
+                    models_run=", ".join(combined_df["model_name"].unique()),
+                )
             )
-            f.write(f"Deepfake frames: {deepfake_frames}/{total_frames}\n")
-            f.write(f"Average confidence: {ensemble_df['confidence'].mean():.4f}\n")
-            f.write(f"Model configurations: {self.model_configs}\n")
 
         print(f"Final result saved to: {result_txt_path}")
-        print(f"Final Ensemble Result: {'DEEPFAKE' if final_result else 'REAL'}")
+        print(f"Final Ensemble Result: {verdict}")
 
         return final_result
 
@@ -236,6 +407,8 @@ class PipelineDeepfakeDetection:
         output_folder: str,
         save_csv: bool = True,
         num_frames: int = 11,
+        batch_size: int = 16,
+        early_exit_margin: Optional[float] = None,
     ) -> bool:
         """Run the complete ensemble deepfake detection pipeline.
 
@@ -244,6 +417,11 @@ class PipelineDeepfakeDetection:
             output_folder: Folder path to save all detection results
             save_csv: Whether to save detection results to CSV files
             num_frames: Number of equally spaced frames for video analysis
+            batch_size: Number of video frames per model forward pass
+            early_exit_margin: Skip the more expensive models once the weighted
+                mean deepfake probability of the models run so far is further
+                than this from the confidence threshold. Runs every model if
+                None.
 
         Returns:
             Final ensemble prediction (True for deepfake, False for real)
@@ -267,6 +445,8 @@ class PipelineDeepfakeDetection:
             output_folder=output_folder,
             save_csv=save_csv,
             num_frames=num_frames,
+            batch_size=batch_size,
+            early_exit_margin=early_exit_margin,
         )
 
         if success and detection_dataframes:
@@ -289,6 +469,10 @@ class PipelineDeepfakeDetection:
             "model_configs": self.model_configs,
             "device": str(self.device),
             "confidence_threshold": self.confidence_threshold,
+            "use_jit": self.use_jit,
+            "use_compile": self.use_compile,
+            "precision": self.precision,
+            "backend": self.backend,
             "total_models": len(self.model_configs),
         }
 
@@ -300,6 +484,7 @@ def run_ensemble_pipeline(
     output_folder: str,
     save_csv: bool = True,
     num_frames: int = 11,
+    batch_size: int = 16,
 ) -> bool:
     """Legacy function to run the complete ensemble pipeline.
 
@@ -309,12 +494,13 @@ def run_ensemble_pipeline(
         output_folder: Folder path to save all detection results
         save_csv: Whether to save detection results to CSV files
         num_frames: Number of equally spaced frames for video analysis
+        batch_size: Number of video frames per model forward pass
 
     Returns:
         Final ensemble prediction (True for deepfake, False for real)
     """
     detector = PipelineDeepfakeDetection(model_configs)
-    return detector.detect(media_path, output_folder, save_csv, num_frames)
+    return detector.detect(media_path, output_folder, save_csv, num_frames, batch_size)
 
 
 def main():
@@ -346,6 +532,19 @@ def main():
         default=11,
         help="Number of equally spaced frames to extract from video for analysis.",
     )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=16,
+        help="Number of video frames to run through each model per forward pass.",
+    )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        default="torch",
+        choices=list(BACKENDS),
+        help="Inference backend for the models.",
+    )
 
     args = parser.parse_args()
 
@@ -353,12 +552,13 @@ def main():
     model_configs = {"resnet_inception": 0.5, "efficientnet": 0.5}
 
     # Create ensemble detector and run detection
-    detector = PipelineDeepfakeDetection(model_configs)
+    detector = PipelineDeepfakeDetection(model_configs, backend=args.backend)
     detector.detect(
         media_path=args.media_path,
         output_folder=args.output_folder,
         save_csv=args.save_csv,
         num_frames=args.num_frames,
+        batch_size=args.batch_size,
     )
 
 
@@ -6,7 +6,7 @@ LICENSE: MIT License
 """
 
 import os
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import cv2
 import imageio
@@ -15,9 +15,11 @@ import torch
 from skimage import img_as_ubyte
 from skimage.transform import resize
 
+from mukh.core.jit import trace_module
 from mukh.reenactment.models.base_reenactor import BaseFaceReenactor
 from mukh.reenactment.models.thin_plate_spline.utils import (
     find_best_frame,
+    iter_animation,
     load_checkpoints,
     make_animation,
 )
@@ -98,6 +100,25 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
         except Exception as e:
             raise ValueError(f"Failed to load model from {self.model_path}: {str(e)}")
 
+    def trace(self, cache_dir: Optional[str] = None) -> None:
+        """Replaces the keypoint detector with a traced TorchScript module.
+
+        The keypoint detector runs on every driving frame with a fixed input
+        shape. The dense motion and inpainting networks take dictionary and
+        optional inputs and are left in eager mode.
+
+        Args:
+            cache_dir: Directory for cached traces. Uses the default if None.
+        """
+        example_input = torch.zeros(1, 3, self.pixel, self.pixel, device=self.device)
+        self.kp_detector = trace_module(
+            self.kp_detector,
+            example_input,
+            cache_key=f"tps_kp_detector:{os.path.abspath(self.model_path)}",
+            cache_dir=cache_dir,
+            strict=False,
+        )
+
     def _read_image(self, image_path: str) -> np.ndarray:
         """Reads and preprocesses an image from a file path.
 
@@ -148,75 +169,77 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
         except Exception as e:
             raise ValueError(f"Failed to read video from {video_path}: {str(e)}")
 
-    def _postprocess(self, predictions: list, original_shape: Tuple[int, int]) -> list:
-        """Postprocesses the generated frames to match original image resolution.
+    def _postprocess_frame(
+        self, frame: np.ndarray, original_shape: Tuple[int, int]
+    ) -> np.ndarray:
+        """Resizes a generated frame to the original image resolution.
 
         Args:
-            predictions: List of generated frames from the model.
+            frame: Generated frame from the model.
             original_shape: Original shape (height, width) to resize to.
 
         Returns:
-            List of postprocessed frames.
+            Postprocessed frame.
         """
-        if predictions[0].shape[:2] == original_shape:
-            return predictions
+        if frame.shape[:2] == original_shape:
+            return frame
 
-        postprocessed = []
-        for frame in predictions:
-            # Resize to original resolution
-            resized_frame = resize(frame, original_shape, anti_aliasing=True)
-            postprocessed.append(resized_frame)
+        return resize(frame, original_shape, anti_aliasing=True)
 
-        return postprocessed
-
-    def _save_comparison_animation(
-        self,
-        source_image: np.ndarray,
-        driving_video: list,
-        predictions: list,
-        output_path: str,
-        fps: float,
-    ) -> str:
-        """Creates and saves a comparison animation of source, driving, and generated frames.
+    def _iter_predictions(
+        self, source_image: np.ndarray, driving_video: list
+    ) -> Iterator[np.ndarray]:
+        """Yields generated frames in driving video order.
 
         Args:
-            source_image: Source image used for reenactment
-            driving_video: List of driving video frames
-            predictions: List of generated frames
-            output_path: Path where to save the comparison animation
-            fps: Frames per second for the animation
+            source_image: Preprocessed source image.
+            driving_video: Preprocessed driving video frames.
 
-        Returns:
-            str: Path to the saved comparison animation
+        Yields:
+            Generated frames at model resolution.
         """
-        import matplotlib.animation as animation
-        import matplotlib.pyplot as plt
-
-        # Resize all inputs to match dimensions
-        target_shape = predictions[0].shape[:2]
-        resized_source = resize(source_image, target_shape, anti_aliasing=True)
-        resized_driving = [
-            resize(frame, target_shape, anti_aliasing=True) for frame in driving_video
-        ]
-
-        fig = plt.figure(figsize=(12, 6))
+        models = (
+            self.inpainting,
+            self.kp_detector,
+            self.dense_motion_network,
+            self.avd_network,
+        )
 
-        ims = []
-        for i in range(len(resized_driving)):
-            cols = [resized_source]
-            cols.append(resized_driving[i])
-            cols.append(predictions[i])
-            im = plt.imshow(np.concatenate(cols, axis=1), animated=True)
-            plt.axis("off")
-            ims.append([im])
+        if self.predict_mode == "relative" and self.find_best_frame:
+            i = find_best_frame(source_image, driving_video, self.device.type == "cpu")
 
-        ani = animation.ArtistAnimation(fig, ims, interval=50, repeat_delay=1000)
+            driving_forward = driving_video[i:]
+            driving_backward = driving_video[: (i + 1)][::-1]
 
-        # Save the comparison animation
-        ani.save(output_path, writer="ffmpeg", fps=fps)
-        plt.close()
+            # The backward pass runs away from the best frame, so it has to be
+            # collected before it can be reversed
+            predictions_backward = make_animation(
+                source_image,
+                driving_backward,
+                *models,
+                device=self.device,
+                mode=self.predict_mode,
+            )
+            yield from reversed(predictions_backward)
+            del predictions_backward
 
-        return output_path
+            predictions_forward = iter_animation(
+                source_image,
+                driving_forward,
+                *models,
+                device=self.device,
+                mode=self.predict_mode,
+            )
+            next(predictions_forward)  # Best frame was already yielded
+            yield from predictions_forward
+        else:
+            yield from iter_animation(
+                source_image,
+                driving_video,
+                *models,
+                device=self.device,
+                mode=self.predict_mode,
+            )
 
     def reenact_from_video(
         self,
@@ -232,7 +255,7 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
             source_path: Path to the source image (face to be animated).
             driving_video_path: Path to the driving video (facial motion to transfer).
             output_path: Optional path to the output directory. Defaults to "output".
-            save_comparison: Whether to save a comparison animation showing source,
+            save_comparison: Whether to save a comparison video showing source,
                 driving, and generated frames side by side. Defaults to False.
             resize_to_image_resolution: Whether to resize the output video to match
                 the original source image resolution. Defaults to True.
@@ -264,67 +287,38 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
             output_path, f"reenacted_{source_name}_by_{driving_name}.mp4"
         )
 
-        # Perform reenactment based on predict_mode and find_best_frame settings
-        if self.predict_mode == "relative" and self.find_best_frame:
-            i = find_best_frame(source_image, driving_video, self.device.type == "cpu")
-
-            driving_forward = driving_video[i:]
-            driving_backward = driving_video[: (i + 1)][::-1]
-
-            predictions_forward = make_animation(
-                source_image,
-                driving_forward,
-                self.inpainting,
-                self.kp_detector,
-                self.dense_motion_network,
-                self.avd_network,
-                device=self.device,
-                mode=self.predict_mode,
-            )
-
-            predictions_backward = make_animation(
-                source_image,
-                driving_backward,
-                self.inpainting,
-                self.kp_detector,
-                self.dense_motion_network,
-                self.avd_network,
-                device=self.device,
-                mode=self.predict_mode,
-            )
-
-            predictions = predictions_backward[::-1] + predictions_forward[1:]
-        else:
-            predictions = make_animation(
-                source_image,
-                driving_video,
-                self.inpainting,
-                self.kp_detector,
-                self.dense_motion_network,
-                self.avd_network,
-                device=self.device,
-                mode=self.predict_mode,
-            )
-
-        # Postprocess predictions if needed
-        if resize_to_image_resolution:
-            predictions = self._postprocess(predictions, original_shape)
-
-        # Save the resulting video
-        imageio.mimsave(
-            output_video_path, [img_as_ubyte(frame) for frame in predictions], fps=fps
+        comparison_path = os.path.join(
+            output_path, f"comparison_{source_name}_by_{driving_name}.mp4"
         )
 
-        # Optionally save comparison animation
+        # Comparison frames place the source, driving and generated frames
+        # side by side at the resolution of the output video
+        target_shape = (
+            original_shape if resize_to_image_resolution else source_image.shape[:2]
+        )
         if save_comparison:
-            # Create comparison output path
-            comparison_path = os.path.join(
-                output_path, f"comparison_{source_name}_by_{driving_name}.mp4"
-            )
+            comparison_source = self._postprocess_frame(source_image, target_shape)
 
-            # Create and save the comparison animation
-            self._save_comparison_animation(
-                source_image, driving_video, predictions, comparison_path, fps
-            )
+        # Generate frames and stream them to the encoders as they are produced
+        writer = imageio.get_writer(output_video_path, fps=fps)
+        comparison_writer = (
+            imageio.get_writer(comparison_path, fps=fps) if save_comparison else None
+        )
+        try:
+            predictions = self._iter_predictions(source_image, driving_video)
+            for driving_frame, frame in zip(driving_video, predictions):
+                frame = self._postprocess_frame(frame, target_shape)
+                writer.append_data(img_as_ubyte(frame))
+
+                if comparison_writer is not None:
+                    driving_frame = self._postprocess_frame(driving_frame, target_shape)
+                    comparison = np.concatenate(
+                        [comparison_source, driving_frame, frame], axis=1
+                    )
+                    comparison_writer.append_data(img_as_ubyte(comparison))
+        finally:
+            writer.close()
+            if comparison_writer is not None:
+                comparison_writer.close()
 
         return output_video_path
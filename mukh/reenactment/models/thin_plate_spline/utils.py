@@ -89,7 +89,8 @@ def load_checkpoints(config_path, checkpoint_path, device):
     return inpainting, kp_detector, dense_motion_network, avd_network
 
 
-def make_animation(
+@torch.no_grad()
+def iter_animation(
     source_image,
     driving_video,
     inpainting_network,
@@ -99,48 +100,71 @@ def make_animation(
     device,
     mode="relative",
 ):
+    """Yields generated frames one at a time.
+
+    Driving frames are moved to the device individually, so memory use does
+    not grow with the length of the driving video.
+    """
     assert mode in ["standard", "relative", "avd"]
-    with torch.no_grad():
-        predictions = []
-        source = torch.tensor(source_image[np.newaxis].astype(np.float32)).permute(
-            0, 3, 1, 2
-        )
-        source = source.to(device)
-        driving = (
-            torch.tensor(np.array(driving_video)[np.newaxis].astype(np.float32))
-            .permute(0, 4, 1, 2, 3)
+
+    def to_tensor(image):
+        return (
+            torch.tensor(image[np.newaxis].astype(np.float32))
+            .permute(0, 3, 1, 2)
             .to(device)
         )
-        kp_source = kp_detector(source)
-        kp_driving_initial = kp_detector(driving[:, :, 0])
-
-        for frame_idx in tqdm(range(driving.shape[2])):
-            driving_frame = driving[:, :, frame_idx]
-            driving_frame = driving_frame.to(device)
-            kp_driving = kp_detector(driving_frame)
-            if mode == "standard":
-                kp_norm = kp_driving
-            elif mode == "relative":
-                kp_norm = relative_kp(
-                    kp_source=kp_source,
-                    kp_driving=kp_driving,
-                    kp_driving_initial=kp_driving_initial,
-                )
-            elif mode == "avd":
-                kp_norm = avd_network(kp_source, kp_driving)
-            dense_motion = dense_motion_network(
-                source_image=source,
-                kp_driving=kp_norm,
+
+    source = to_tensor(source_image)
+    kp_source = kp_detector(source)
+    kp_driving_initial = kp_detector(to_tensor(np.asarray(driving_video[0])))
+
+    for driving_image in tqdm(driving_video):
+        driving_frame = to_tensor(np.asarray(driving_image))
+        kp_driving = kp_detector(driving_frame)
+        if mode == "standard":
+            kp_norm = kp_driving
+        elif mode == "relative":
+            kp_norm = relative_kp(
                 kp_source=kp_source,
-                bg_param=None,
-                dropout_flag=False,
+                kp_driving=kp_driving,
+                kp_driving_initial=kp_driving_initial,
             )
-            out = inpainting_network(source, dense_motion)
+        elif mode == "avd":
+            kp_norm = avd_network(kp_source, kp_driving)
+        dense_motion = dense_motion_network(
+            source_image=source,
+            kp_driving=kp_norm,
+            kp_source=kp_source,
+            bg_param=None,
+            dropout_flag=False,
+        )
+        out = inpainting_network(source, dense_motion)
 
-            predictions.append(
-                np.transpose(out["prediction"].data.cpu().numpy(), [0, 2, 3, 1])[0]
-            )
-    return predictions
+        yield np.transpose(out["prediction"].data.cpu().numpy(), [0, 2, 3, 1])[0]
+
+
+def make_animation(
+    source_image,
+    driving_video,
+    inpainting_network,
+    kp_detector,
+    dense_motion_network,
+    avd_network,
+    device,
+    mode="relative",
+):
+    return list(
+        iter_animation(
+            source_image,
+            driving_video,
+            inpainting_network,
+            kp_detector,
+            dense_motion_network,
+            avd_network,
+            device,
+            mode=mode,
+        )
+    )
 
 
 def find_best_frame(source, driving, cpu):